@@ -18,6 +18,18 @@ sys.path.append(os.path.abspath("../src"))
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom ones.
 extensions = ["sphinx.ext.autodoc"]
 
+# Standard library types in signatures cannot be linked without intersphinx.
+nitpick_ignore = [
+    ("py:class", "array.array"),
+    ("py:class", "datetime.datetime"),
+    ("py:class", "listparser.xml_handler.XMLHandler"),
+    ("py:class", "mmap.mmap"),
+    ("py:class", "os.PathLike"),
+    ("py:class", "requests.sessions.Session"),
+    ("py:class", "t.Iterable"),
+    ("py:class", "t.Mapping"),
+]
+
 # The master toctree document.
 master_doc = "index"
 
@@ -4,28 +4,73 @@
 
 from __future__ import annotations
 
-import io
+import asyncio
+import collections
+import concurrent.futures
+import datetime
+import functools
+import itertools
+import mmap
+import os
+import time
 import typing as t
 
 try:
     import requests
-    import urllib3.exceptions
 except ImportError:
     requests = None  # type: ignore[assignment]
-    urllib3 = None  # type: ignore[assignment]
 
 try:
     import lxml.etree
 except ImportError:
     lxml = None  # type: ignore[assignment]
 
-from . import common, foaf, opml, xml_handler
-from .exceptions import ListparserError
+from . import (
+    backends,
+    batch,
+    charsets,
+    common,
+    dates,
+    foaf,
+    objects,
+    opml,
+    resolve,
+    transports,
+    writer,
+    xml_handler,
+)
+from .cache import Cache
+from .dedupe import FeedIndex
+from .exceptions import LimitExceededError, ListparserError
 
 __author__ = "Kurt McKee <contactme@kurtmckee.org>"
 __url__ = "https://github.com/kurtmckee/listparser"
 __version__ = "0.19"
 
+# The number of bytes fed to the parser at a time
+# when streaming results or reading files and buffers.
+CHUNK_SIZE = 64 * 1024
+
+# The types of objects that can be parsed.
+Source = t.Union[
+    str,
+    bytes,
+    bytearray,
+    memoryview,
+    mmap.mmap,
+    "os.PathLike[str]",
+    t.BinaryIO,
+]
+
+
+# Results are written as OPML documents by the writer module.
+dump = writer.dump
+dumps = writer.dumps
+
+
+# The keys of a result that are filled in by parsing the document.
+parsed_keys = frozenset({*common.sections, "meta", "version", "tree", "backend"})
+
 
 Handler = type(
     "Handler",
@@ -38,85 +83,964 @@ Handler = type(
 )
 
 
-def parse(parse_obj: str | bytes) -> common.SuperDict:
+def parse(
+    parse_obj: Source,
+    etag: str | None = None,
+    modified: str | datetime.datetime | None = None,
+    cache: Cache | None = None,
+    transport: transports.Transport | None = None,
+    resolve_lists: bool = False,
+    max_depth: int = 3,
+    result_type: t.Literal["dict", "slots"] = "dict",
+    tree: bool = False,
+    keep_attributes: bool | t.Iterable[str] = False,
+    only: t.Iterable[str] | None = None,
+    max_elements: int | None = None,
+    max_nesting: int | None = None,
+    max_bytes: int | None = None,
+    max_time: float | None = None,
+    backend: str = "auto",
+    lazy_dates: bool = False,
+    index: FeedIndex | None = None,
+) -> common.SuperDict:
     """Parse a subscription list and return a dict containing the results.
 
     *parse_obj* must be one of the following:
 
     *   a string containing a URL
     *   a string or bytes object containing an XML document
+    *   a path-like object, such as a ``pathlib.Path``
+    *   a binary file object
+    *   a buffer, such as a ``memoryview`` or ``mmap.mmap`` object
+
+    Files are read incrementally, so the document is never held in memory
+    in its entirety unless it was passed in that way.
+
+    If *parse_obj* is a URL, *etag* and *modified* are sent to the server
+    in ``If-None-Match`` and ``If-Modified-Since`` headers.
+    If the server responds that the document hasn't changed,
+    the result will have a ``status`` of 304 and no feeds.
+
+    If a *cache* is given, results are stored in it by URL,
+    and their ``etag`` and ``modified`` values are sent automatically.
+    The cache is only used if *tree*, *keep_attributes*, *only*,
+    and *lazy_dates* have their default values.
+    If the server responds that the document hasn't changed,
+    the cached result is returned without downloading or parsing the document.
+    See :doc:`/http-features` for more information.
+
+    URLs are retrieved using *transport*.
+    If no transport is given, a shared
+    :py:class:`~listparser.transports.RequestsTransport` is used
+    so that connections are reused across calls.
+
+    If *resolve_lists* is true, the subscription lists found in the document
+    are retrieved and their contents are merged into the result,
+    up to *max_depth* levels deep.
+    See :doc:`/resolving-lists` for more information.
+
+    If *result_type* is ``"slots"``, the feeds, lists, opportunities,
+    and metadata are returned as lightweight objects
+    that use less memory and have faster attribute access.
+    See :doc:`/reference/slots` for more information.
+
+    If *tree* is true, the result will contain a ``tree`` key
+    with the document's folder structure.
+    See :doc:`/reference/tree` for more information.
+
+    If *keep_attributes* is true, the attributes of each OPML outline
+    are stored in the ``attributes`` key of the object it describes.
+    If it is a collection of attribute names, only those are stored.
+    See :doc:`/reference/object-attributes` for more information.
+
+    If *only* is given, only the named parts of the result are extracted,
+    which avoids the work of extracting the others.
+    See :doc:`/selective-extraction` for more information.
+
+    *max_elements*, *max_nesting*, *max_bytes*, and *max_time* limit
+    the number of elements, the element nesting depth, the document size,
+    and the number of seconds spent parsing.
+    If a limit is exceeded, parsing stops and a partial result is returned.
+    See :doc:`/limits` for more information.
+
+    *backend* names the parser that parses the document.
+    By default, the fastest available parser is used.
+    See :doc:`/backends` for more information.
+
+    If *lazy_dates* is true, the ``created_parsed`` and ``modified_parsed``
+    metadata are only parsed when they are first accessed.
+    Invalid dates do not set ``bozo``, because they are not parsed
+    while the document is parsed.
+    See :doc:`/reference/meta-created_parsed` for more information.
+
+    If an *index* is given, the URLs found in the document are added to it,
+    and the result will contain a ``deduplication`` key that reports
+    which entries were new and which were already in the index.
+    See :doc:`/reference/deduplication` for more information.
 
     The dictionary returned will contain all of the parsed information,
     HTTP response headers (if applicable), and any exception encountered.
     """
 
-    guarantees: dict[str, t.Any] = {
-        "bozo": False,
-        "bozo_exception": None,
-        "feeds": [],
-        "lists": [],
-        "opportunities": [],
-        "meta": common.SuperDict(),
-        "version": "",
-    }
-    content, info = get_content(parse_obj)
-    guarantees.update(info)
-    if not content:
-        return common.SuperDict(guarantees)
-
-    handler = Handler()
-    handler.harvest.update(guarantees)
-
-    if lxml is not None:
-        content_file = io.BytesIO(content)
-        parser = lxml.etree.HTMLParser(target=handler, recover=True)
-        lxml.etree.parse(content_file, parser)
+    # The subscription lists must be extracted so that they can be resolved.
+    # The sections and fields that were not requested are removed afterward.
+    wanted = None
+    if resolve_lists and only is not None:
+        only = [only] if isinstance(only, str) else list(only)
+        wanted = common.parse_fields(only)
+        only.append("lists")
+
+    # Results are cached by URL, so only results parsed with the default
+    # extraction options can be cached and reused.
+    cache_url = None
+    if (
+        cache is not None
+        and isinstance(parse_obj, str)
+        and _is_url(parse_obj)
+        and not (tree or keep_attributes is not False or only is not None)
+        and not lazy_dates
+    ):
+        cache_url = parse_obj
+    # Slotted objects are created while the document is parsed,
+    # unless the result must be cached or merged as dictionaries first.
+    slots_while_parsing = (
+        result_type == "slots" and cache_url is None and not resolve_lists
+    )
+    cached = None
+    if cache is not None and cache_url is not None:
+        cached = cache.get(cache_url)
+        if cached is not None:
+            etag = etag or cached.get("etag")
+            modified = modified or cached.get("modified")
+
+    source, info = get_content(
+        parse_obj, etag=etag, modified=modified, transport=transport
+    )
+    if cached is not None and info.get("status") == 304:
+        result = _reuse_cached(cached, info)
+    else:
+        result = _parse_source(
+            source,
+            info,
+            tree=tree,
+            keep_attributes=keep_attributes,
+            only=only,
+            max_elements=max_elements,
+            max_nesting=max_nesting,
+            max_bytes=max_bytes,
+            max_time=max_time,
+            backend=backend,
+            lazy_dates=lazy_dates,
+            result_type="slots" if slots_while_parsing else "dict",
+        )
+        if cache is not None and cache_url is not None:
+            _cache_result(cache, cache_url, result)
+
+    if resolve_lists:
+
+        def fetch(list_url: str) -> common.SuperDict:
+            if not _is_url(list_url):
+                message = f"{list_url!r} is not a URL and cannot be retrieved"
+                error = ListparserError(message)
+                return _parse_source(None, {"bozo": True, "bozo_exception": error})
+            return parse(
+                list_url,
+                cache=cache,
+                transport=transport,
+                keep_attributes=keep_attributes,
+                only=only,
+                max_elements=max_elements,
+                max_nesting=max_nesting,
+                max_bytes=max_bytes,
+                max_time=max_time,
+                backend=backend,
+                lazy_dates=lazy_dates,
+            )
+
+        result = resolve.resolve_lists(result, fetch, max_depth, wanted)
+    if result_type == "slots" and not slots_while_parsing:
+        result = objects.from_result(result)
+    if index is not None:
+        # The result may be cached, so the report is added to a copy.
+        result = common.SuperDict(result, deduplication=index.add_result(result))
+    return result
+
+
+async def aparse(
+    parse_obj: Source,
+    etag: str | None = None,
+    modified: str | datetime.datetime | None = None,
+    cache: Cache | None = None,
+    transport: transports.AsyncTransport | None = None,
+) -> common.SuperDict:
+    """Parse a subscription list without blocking the event loop.
+
+    *parse_obj*, *etag*, *modified*, and *cache* accept the same values
+    as :py:func:`parse`.
+
+    URLs are retrieved using *transport*.
+    If no transport is given, requests is used in a worker thread,
+    and connections are shared with :py:func:`parse`.
+    Documents are parsed in a worker thread.
+    """
+
+    if not (isinstance(parse_obj, str) and _is_url(parse_obj)):
+        return await asyncio.to_thread(parse, parse_obj)
+
+    url = parse_obj
+    cached = None
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            etag = etag or cached.get("etag")
+            modified = modified or cached.get("modified")
+
+    source: bytes | None
+    if transport is None and requests is None:
+        source, info = None, _requests_missing(url)  # type: ignore[unreachable]
+    else:
+        transport = transport or transports.default()
+        try:
+            response = await transport.get(url, _request_headers(etag, modified))
+        except Exception as error:
+            source, info = None, {"bozo": True, "bozo_exception": error}
+        else:
+            source, info = _response_info(response)
+
+    if cached is not None and info.get("status") == 304:
+        return _reuse_cached(cached, info)
+
+    result = await asyncio.to_thread(_parse_source, source, info)
+    if cache is not None:
+        _cache_result(cache, url, result)
+    return result
+
+
+async def aparse_many(
+    sources: t.Iterable[Source],
+    concurrency: int = 10,
+    cache: Cache | None = None,
+    transport: transports.AsyncTransport | None = None,
+) -> list[common.SuperDict]:
+    """Parse many subscription lists concurrently.
+
+    At most *concurrency* documents are retrieved and parsed at a time.
+    *cache* and *transport* are passed to :py:func:`aparse`.
+
+    The results are returned in the same order as *sources*.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def parse_one(source: Source) -> common.SuperDict:
+        async with semaphore:
+            return await aparse(source, cache=cache, transport=transport)
+
+    return await asyncio.gather(*(parse_one(source) for source in sources))
+
+
+@t.overload
+def parse_many(
+    sources: t.Iterable[Source],
+    workers: int | None = None,
+    executor: t.Literal["process", "thread"] = "process",
+    ordered: t.Literal[True] = True,
+    chunksize: int = 16,
+    transport: transports.Transport | None = None,
+    index: FeedIndex | None = None,
+) -> t.Iterator[common.SuperDict]: ...
+
+
+@t.overload
+def parse_many(
+    sources: t.Iterable[Source],
+    workers: int | None = None,
+    executor: t.Literal["process", "thread"] = "process",
+    *,
+    ordered: t.Literal[False],
+    chunksize: int = 16,
+    transport: transports.Transport | None = None,
+    index: FeedIndex | None = None,
+) -> t.Iterator[tuple[int, common.SuperDict]]: ...
+
+
+def parse_many(
+    sources: t.Iterable[Source],
+    workers: int | None = None,
+    executor: t.Literal["process", "thread"] = "process",
+    ordered: bool = True,
+    chunksize: int = 16,
+    transport: transports.Transport | None = None,
+    index: FeedIndex | None = None,
+) -> t.Iterator[common.SuperDict] | t.Iterator[tuple[int, common.SuperDict]]:
+    """Parse many subscription lists in parallel.
+
+    Documents are parsed by *workers* worker processes or threads,
+    depending on whether *executor* is ``"process"`` or ``"thread"``.
+    When using processes, *sources* must be picklable;
+    file objects and buffers cannot be sent to worker processes.
+
+    To reduce the overhead of sending work to workers,
+    documents are sent to the workers in chunks of *chunksize* documents.
+    *sources* is consumed lazily, so it may be a generator.
+
+    If *ordered* is true, results are yielded in the same order as *sources*.
+    Otherwise, ``(index, result)`` tuples are yielded as results are completed,
+    where *index* is the position of the document in *sources*.
+
+    URLs are retrieved using *transport*, which is passed to :py:func:`parse`.
+    Worker threads share the transport and its connections;
+    each worker process receives its own copy.
+
+    If an *index* is given, the URLs in each result are added to it
+    as the result is yielded, as described in :py:func:`parse`.
+    The index is only used by the calling thread,
+    so documents are deduplicated in the order their results are yielded.
+    """
+
+    results = _parse_chunks(sources, workers, executor, ordered, chunksize, transport)
+    if index is not None:
+        results = _index_results(results, index)
+    if ordered:
+        return (result for _, result in results)
+    return results
+
+
+def _index_results(
+    results: t.Iterator[tuple[int, common.SuperDict]], index: FeedIndex
+) -> t.Iterator[tuple[int, common.SuperDict]]:
+    for position, result in results:
+        result["deduplication"] = index.add_result(result)
+        yield position, result
+
+
+def _parse_chunks(
+    sources: t.Iterable[Source],
+    workers: int | None,
+    executor: t.Literal["process", "thread"],
+    ordered: bool,
+    chunksize: int,
+    transport: transports.Transport | None,
+) -> t.Iterator[tuple[int, common.SuperDict]]:
+    pool: concurrent.futures.Executor
+    if executor == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
     else:
-        handler.feed(content.decode())  # type: ignore[unreachable]
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    pack = executor == "process"
+
+    # Limit the number of chunks submitted to the pool at once
+    # so that *sources* is consumed lazily.
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+
+    # {future: [index, ...]}
+    pending: dict[concurrent.futures.Future[list[t.Any]], list[int]] = {}
+
+    def collect() -> t.Iterator[tuple[int, common.SuperDict]]:
+        done: t.Iterable[concurrent.futures.Future[list[t.Any]]]
+        if ordered:
+            done = [next(iter(pending))]
+        else:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+        for future in done:
+            indexes = pending.pop(future)
+            try:
+                results = future.result()
+            except Exception as error:
+                info = {"bozo": True, "bozo_exception": error}
+                results = [_parse_source(None, dict(info)) for _ in indexes]
+            else:
+                if pack:
+                    results = [batch.unpack(result) for result in results]
+            yield from zip(indexes, results)
+
+    iterator = enumerate(sources)
+    try:
+        while chunk := list(itertools.islice(iterator, chunksize)):
+            indexes = [index for index, _ in chunk]
+            documents = [document for _, document in chunk]
+            future = pool.submit(_parse_chunk, documents, pack, transport)
+            pending[future] = indexes
+            if len(pending) >= max_pending:
+                yield from collect()
+        while pending:
+            yield from collect()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _parse_chunk(
+    sources: list[Source],
+    pack: bool,
+    transport: transports.Transport | None = None,
+) -> list[t.Any]:
+    """Parse a chunk of documents in a worker."""
+
+    results = [parse(source, transport=transport) for source in sources]
+    if pack:
+        return [batch.pack(result) for result in results]
+    return results
+
+
+def _parse_source(
+    source: Source | None, info: dict[str, t.Any], **options: t.Any
+) -> common.SuperDict:
+    """Parse a source returned by :py:func:`get_content`.
+
+    *options* are passed to :py:class:`Parser`.
+    """
+
+    parser = Parser(encoding=info.pop("encoding", None), **options)
+    parser.handler.harvest.update(info)
+    if source is not None:
+        parser._reread_from(source)
+    if isinstance(source, (str, bytes)):
+        parser.feed(source)
+    elif isinstance(source, (bytearray, memoryview, mmap.mmap)):
+        for chunk in _iter_chunks(source):
+            parser.feed(chunk)
+    elif source is not None:
+        parser.feed_file(source)
+    return parser.close()
+
+
+def _reuse_cached(cached: common.SuperDict, info: dict[str, t.Any]) -> common.SuperDict:
+    """Update a copy of a cached result with a 304 response's information."""
+
+    result = common.SuperDict(cached)
+    result.update(info)
+    return result
+
+
+def _cache_result(cache: Cache, url: str, result: common.SuperDict) -> None:
+    """Cache a result if it can be used for conditional requests later.
+
+    Results with errors, including partial results that were stopped
+    by a limit, are not cached, because a 304 response would hide the error.
+    """
+
+    if result.get("bozo") or result.get("status") != 200:
+        return
+    if result.get("etag") or result.get("modified"):
+        cache.set(url, result)
+
 
-    harvest = common.SuperDict(handler.harvest)
-    handler.close()
-    del handler
+def iterparse(
+    parse_obj: Source,
+    etag: str | None = None,
+    modified: str | datetime.datetime | None = None,
+    transport: transports.Transport | None = None,
+    keep_attributes: bool | t.Iterable[str] = False,
+    only: t.Iterable[str] | None = None,
+    max_elements: int | None = None,
+    max_nesting: int | None = None,
+    max_bytes: int | None = None,
+    max_time: float | None = None,
+    backend: str = "auto",
+    lazy_dates: bool = False,
+) -> t.Iterator[tuple[str, t.Any]]:
+    """Parse a subscription list and yield results as they are found.
 
-    return harvest
+    *parse_obj*, *etag*, *modified*, *transport*, *keep_attributes*, *only*,
+    *max_elements*, *max_nesting*, *max_bytes*, *max_time*, *backend*,
+    and *lazy_dates* accept the same values as :py:func:`parse`.
 
+    ``(key, value)`` tuples are yielded while the document is parsed:
 
-def get_content(obj: bytes | str) -> tuple[bytes | None, dict[str, t.Any]]:
-    if isinstance(obj, bytes):
+    ``("meta", meta)``
+        The ``meta`` dictionary, yielded once the OPML ``<head>`` closes.
+        If the document has no ``<head>``, it is yielded at the end.
+
+    ``("feeds", obj)``, ``("lists", obj)``, ``("opportunities", obj)``
+        A new object, yielded as soon as its categories and tags are known.
+        If the same URL appears again later in the document,
+        its categories and tags are merged into the object already yielded.
+
+    ``("document", info)``
+        Always yielded last.
+        A dictionary containing the ``bozo``, ``bozo_exception``,
+        and ``version`` keys, plus HTTP information (if applicable).
+
+    The ``feeds``, ``lists``, and ``opportunities`` lists are never built.
+    However, each object that is yielded is remembered
+    until the document has been parsed,
+    so that duplicate URLs found later can be merged into it.
+    Memory use therefore still grows with the number of distinct URLs.
+    """
+
+    source, info = get_content(
+        parse_obj, etag=etag, modified=modified, transport=transport
+    )
+    parser = Parser(
+        stream=True,
+        encoding=info.pop("encoding", None),
+        keep_attributes=keep_attributes,
+        only=only,
+        max_elements=max_elements,
+        max_nesting=max_nesting,
+        max_bytes=max_bytes,
+        max_time=max_time,
+        backend=backend,
+        lazy_dates=lazy_dates,
+    )
+    parser.handler.harvest.update(info)
+    if source is not None:
+        try:
+            for chunk in _iter_chunks(source):
+                parser.feed(chunk)
+                yield from parser.read_events()
+        except OSError as error:
+            parser.handler.harvest["bozo"] = True
+            parser.handler.harvest["bozo_exception"] = error
+
+    result = parser.close()
+    yield from parser.read_events()
+
+    for key in (*common.sections, "meta"):
+        del result[key]
+    yield "document", result
+
+
+class Parser:
+    """Parse a subscription list incrementally.
+
+    Pass the document to :py:meth:`feed` in chunks as they become available,
+    such as while bytes are arriving from the network or from a large file.
+    Then call :py:meth:`close` to get the same dictionary
+    that :py:func:`parse` returns.
+
+    ..  code-block:: python
+
+        parser = listparser.Parser()
+        while chunk := sock.recv(4096):
+            parser.feed(chunk)
+        result = parser.close()
+
+    If *stream* is true, feeds, lists, and opportunities
+    are not collected in the result.
+    Instead, they must be retrieved using :py:meth:`read_events`
+    after each call to :py:meth:`feed` and :py:meth:`close`.
+
+    *tree*, *keep_attributes*, *only*, *max_elements*, *max_nesting*,
+    *max_bytes*, *max_time*, *backend*, *lazy_dates*, and *result_type*
+    accept the same values as :py:func:`parse`.
+    If *result_type* is ``"slots"``, each object is created as a slotted object
+    when it is found, so no dictionary is kept for it.
+    The *max_time* clock starts when the parser is created.
+    """
+
+    def __init__(
+        self,
+        stream: bool = False,
+        encoding: str | None = None,
+        tree: bool = False,
+        keep_attributes: bool | t.Iterable[str] = False,
+        only: t.Iterable[str] | None = None,
+        max_elements: int | None = None,
+        max_nesting: int | None = None,
+        max_bytes: int | None = None,
+        max_time: float | None = None,
+        backend: str = "auto",
+        lazy_dates: bool = False,
+        result_type: t.Literal["dict", "slots"] = "dict",
+    ) -> None:
+        self.backend_class = backends.choose(backend, stream)
+
+        # The options are kept so that the handler can be recreated
+        # if the document must be parsed again using a different backend.
+        self.stream = stream
+        self.tree = tree
+        if isinstance(keep_attributes, str):
+            keep_attributes = [keep_attributes]
+        if not isinstance(keep_attributes, bool):
+            # Attribute names are reported in lowercase.
+            keep_attributes = frozenset(name.lower() for name in keep_attributes)
+        self.keep_attributes = keep_attributes
+        self.fields = common.parse_fields(only) if only is not None else None
+        self.lazy_dates = lazy_dates
+        self.result_type = result_type
+        self.max_elements = max_elements
+        self.max_nesting = max_nesting
+        self.deadline = None if max_time is None else time.monotonic() + max_time
+        self.handler = self._new_handler()
+
+        self.max_bytes = max_bytes
+        self.bytes_fed = 0
+        # *flag_stopped* is set when a limit is exceeded.
+        # No more content will be parsed.
+        self.flag_stopped = False
+
+        # *encoding* is typically the charset in an HTTP Content-Type header.
+        # A byte order mark takes precedence over it,
+        # and it takes precedence over the XML declaration.
+        self.encoding = charsets.normalize(encoding) if encoding else None
+
+        # The underlying parser is created after the encoding is determined.
+        # Until then, bytes are buffered in *prefix*.
+        self.flag_started = False
+        self.prefix = b""
+        self.document_encoding: str | None = None
+
+        # XML parsers stop at the first error. The document is kept in *chunks*
+        # so that it can be parsed again by a parser that recovers from errors
+        # if the document turns out not to be well-formed.
+        # Events that were already read cannot be taken back,
+        # so streaming parsers do not keep the document.
+        self.chunks: list[bytes | str] | None = None if stream else []
+        # If the document can be read again, *reread* is used instead of *chunks*.
+        # It is called with the length of the document that was fed so far.
+        self.reread: t.Callable[[int], t.Iterable[bytes | str]] | None = None
+        self.length_fed = 0
+
+    def _new_handler(self) -> t.Any:
+        """Create a handler configured with the parser's options."""
+
+        handler = Handler()
+        handler.harvest.update(
+            {
+                "bozo": False,
+                "bozo_exception": None,
+                "feeds": [],
+                "lists": [],
+                "opportunities": [],
+                "meta": common.LazyMeta() if self.lazy_dates else common.SuperDict(),
+                "version": "",
+            }
+        )
+        handler.flag_lazy_dates = self.lazy_dates
+        if self.result_type == "slots":
+            handler.entry_types = objects.entry_types
+        if self.stream:
+            handler.events = collections.deque()
+        if self.tree:
+            handler.harvest["tree"] = common.new_folder()
+            handler.hierarchy = common.Hierarchy(handler.harvest["tree"])
+        handler.keep_attributes = self.keep_attributes
+        if self.fields is not None:
+            handler.set_fields(self.fields)
+
+        handler.max_elements = self.max_elements
+        handler.max_nesting = self.max_nesting
+        handler.deadline = self.deadline
+        handler.flag_limited = (
+            self.max_elements is not None
+            or self.max_nesting is not None
+            or self.deadline is not None
+        )
+        return handler
+
+    def _start(self, chunk: bytes | str) -> None:
+        """Create the underlying parser."""
+
+        self.flag_started = True
+        if isinstance(chunk, bytes):
+            self.document_encoding = charsets.detect(chunk, self.encoding)
+
+        self._create_backend(self.backend_class)
+
+    def _create_backend(self, backend_class: type[backends.Backend]) -> None:
+        self.backend = backend_class(self.handler, self.document_encoding)
+        self.handler.harvest["backend"] = backend_class.name
+        if backend_class.recover_with is None:
+            self.chunks = None
+            self.reread = None
+
+    def _reread_from(self, source: Source) -> None:
+        """Read *source* again if the document must be parsed again.
+
+        This avoids keeping the document in memory while it is parsed.
+        Files that are not seekable must still be kept in memory.
+        """
+
+        if self.chunks is None or self.chunks or self.prefix:
+            # The parser is streaming, or part of a document was already fed.
+            return
+        if isinstance(
+            source, (str, bytes, bytearray, memoryview, mmap.mmap, os.PathLike)
+        ):
+            self.reread = functools.partial(_reread, source)
+        else:
+            seekable = getattr(source, "seekable", None)
+            if seekable is None or not seekable():
+                return
+            position = source.tell()
+            self.reread = functools.partial(_reread_file, source, position)
+        self.chunks = None
+
+    def _recover(self, error: Exception) -> None:
+        """Parse the document again after a syntax error."""
+
+        recover_with = self.backend.recover_with
+        if recover_with is None or (self.chunks is None and self.reread is None):
+            self._stop(error)
+            return
+
+        # Information that was not found in the document is kept.
+        harvest = self.handler.harvest
+        self.handler = self._new_handler()
+        for key, value in harvest.items():
+            if key not in parsed_keys:
+                self.handler.harvest[key] = value
+
+        if self.reread is not None:
+            chunks = self.reread(self.length_fed)
+        else:
+            chunks = self.chunks or []
+        self._create_backend(backends.choose(recover_with))
+        for chunk in chunks:
+            self.backend.feed(chunk)
+
+    def feed(self, chunk: bytes | str) -> None:
+        """Parse the next chunk of the document."""
+
+        if not chunk or self.flag_stopped:
+            return
+
+        error = None
+        if self.max_bytes is not None:
+            self.bytes_fed += len(chunk)
+            excess = self.bytes_fed - self.max_bytes
+            if excess > 0:
+                chunk = chunk[: len(chunk) - excess]
+                message = f"the document is larger than {self.max_bytes} bytes"
+                error = LimitExceededError(message)
+        deadline = self.handler.deadline
+        if deadline is not None and time.monotonic() > deadline:
+            chunk = chunk[:0]
+            error = LimitExceededError("the document took too long to parse")
+
+        try:
+            self._feed(chunk)
+        except LimitExceededError as limit_error:
+            error = limit_error
+        if error is not None:
+            self._stop(error)
+
+    def _stop(self, error: Exception) -> None:
+        """Stop parsing because a limit was exceeded or the document is malformed."""
+
+        self.flag_stopped = True
+        self.prefix = b""
+        self.handler.harvest["bozo"] = True
+        self.handler.harvest["bozo_exception"] = error
+
+    def _feed(self, chunk: bytes | str) -> None:
+        if not chunk:
+            return
+
+        if not self.flag_started:
+            if not isinstance(chunk, str):
+                # Buffer bytes until the XML declaration can be examined.
+                self.prefix += chunk
+                if len(self.prefix) < charsets.SNIFF_SIZE and b">" not in self.prefix:
+                    return
+                chunk, self.prefix = self.prefix, b""
+            self._start(chunk)
+
+        if self.chunks is not None:
+            self.chunks.append(chunk)
+        self.length_fed += len(chunk)
+        try:
+            self.backend.feed(chunk)
+        except self.backend.errors as error:
+            self._recover(error)
+
+    def feed_file(self, file: os.PathLike[str] | t.BinaryIO) -> None:
+        """Parse an entire document from a path or a binary file object.
+
+        The file is read and fed to the parser in chunks.
+        If the document must be parsed again after a syntax error,
+        paths and seekable files are read again instead of kept in memory.
+        """
+
+        try:
+            self._reread_from(file)
+            for chunk in _iter_chunks(file):
+                self.feed(chunk)
+        except OSError as error:
+            self.handler.harvest["bozo"] = True
+            self.handler.harvest["bozo_exception"] = error
+
+    def read_events(self) -> t.Iterator[tuple[str, t.Any]]:
+        """Yield and discard the events queued while streaming.
+
+        The events are the same as those yielded by :py:func:`iterparse`,
+        except that there is no final ``"document"`` event.
+        """
+
+        events = self.handler.events
+        while events:
+            yield events.popleft()
+
+    def close(self) -> common.SuperDict:
+        """Finish parsing the document and return the results."""
+
+        if not self.flag_stopped:
+            try:
+                self._close()
+            except LimitExceededError as error:
+                self._stop(error)
+
+        if self.flag_stopped:
+            # Discard any unparsed content and finish the partial result.
+            self.handler.reset()
+            self.handler.close()
+
+        result = common.SuperDict(self.handler.harvest)
+        if self.result_type == "slots":
+            # The entries are already slotted; the metadata is converted here.
+            result = objects.from_result(result)
+        return result
+
+    def _close(self) -> None:
+        # Short documents may still be buffered.
+        if self.prefix:
+            chunk, self.prefix = self.prefix, b""
+            self._start(chunk)
+            self._feed(chunk)
+
+        if not self.flag_started:
+            self.handler.close()
+            return
+
+        try:
+            self.backend.close()
+        except self.backend.errors as error:
+            self._recover(error)
+            if not self.flag_stopped:
+                self.backend.close()
+        self.chunks = None
+        self.reread = None
+
+
+def _iter_chunks(source: Source) -> t.Iterator[bytes | str]:
+    """Yield a document in chunks of (at most) *CHUNK_SIZE*."""
+
+    if isinstance(source, (str, bytes)):
+        for offset in range(0, len(source), CHUNK_SIZE):
+            yield source[offset : offset + CHUNK_SIZE]
+    elif isinstance(source, (bytearray, memoryview, mmap.mmap)):
+        # Only the current chunk is copied out of the buffer.
+        with memoryview(source) as view, view.cast("B") as byte_view:
+            for offset in range(0, len(byte_view), CHUNK_SIZE):
+                yield bytes(byte_view[offset : offset + CHUNK_SIZE])
+    elif isinstance(source, os.PathLike):
+        with open(source, "rb") as file:
+            yield from _iter_chunks(file)
+    else:
+        while chunk := source.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _reread(source: Source, length: int) -> t.Iterator[bytes | str]:
+    """Yield the first *length* bytes or characters of a document again."""
+
+    for chunk in _iter_chunks(source):
+        chunk = chunk[:length]
+        length -= len(chunk)
+        yield chunk
+        if length <= 0:
+            return
+
+
+def _reread_file(
+    file: t.BinaryIO, position: int, length: int
+) -> t.Iterator[bytes | str]:
+    """Yield the first *length* bytes of a file starting at *position* again.
+
+    The file is left where it was, so reading it can continue afterward.
+    """
+
+    file.seek(position)
+    yield from _reread(file, length)
+    file.seek(position + length)
+
+
+def _is_url(obj: str) -> bool:
+    return obj.startswith(("http://", "https://"))
+
+
+def get_content(
+    obj: Source,
+    etag: str | None = None,
+    modified: str | datetime.datetime | None = None,
+    transport: transports.Transport | None = None,
+) -> tuple[Source | None, dict[str, t.Any]]:
+    if isinstance(
+        obj, (bytes, bytearray, memoryview, mmap.mmap, os.PathLike)
+    ) or hasattr(obj, "read"):
+        # Paths, files, and buffers are read by the parser.
         return obj, {"bozo": False, "bozo_exception": None}
     if not isinstance(obj, str):
-        # Only str and bytes objects can be parsed.
+        # Only str objects and the types above can be parsed.
         message = "parse() called with unparsable object"  # type: ignore[unreachable]
         error = ListparserError(message)
 
         return None, {"bozo": True, "bozo_exception": error}
-    if not obj.startswith(("http://", "https://")):
+    if not _is_url(obj):
         # It's not a URL, so it must be treated as an XML document.
-        return obj.encode("utf8"), {
+        return obj, {
             "bozo": False,
             "bozo_exception": None,
         }
 
     # It's a URL. Confirm requests is installed.
-    if requests is None:
-        message = (  # type: ignore[unreachable]
-            f"requests is not installed so {obj} cannot be retrieved"
-        )
-        return None, {
-            "bozo": True,
-            "bozo_exception": ListparserError(message),
-        }
+    if transport is None and requests is None:
+        return None, _requests_missing(obj)  # type: ignore[unreachable]
 
-    headers = {"user-agent": f"listparser/{__version__} +{__url__}"}
+    transport = transport or transports.default()
     try:
-        response = requests.get(obj, headers=headers, timeout=30)
-    except (
-        requests.exceptions.RequestException,
-        urllib3.exceptions.HTTPError,
-    ) as error:
+        response = transport.fetch(obj, _request_headers(etag, modified))
+    except Exception as error:
         return None, {"bozo": True, "bozo_exception": error}
 
-    return response.text.encode("utf8"), {
+    return _response_info(response)
+
+
+def _requests_missing(url: str) -> dict[str, t.Any]:
+    message = f"requests is not installed so {url} cannot be retrieved"
+    return {
+        "bozo": True,
+        "bozo_exception": ListparserError(message),
+    }
+
+
+def _request_headers(
+    etag: str | None, modified: str | datetime.datetime | None
+) -> dict[str, str]:
+    headers = {"user-agent": f"listparser/{__version__} +{__url__}"}
+    if etag:
+        headers["if-none-match"] = etag
+    if isinstance(modified, datetime.datetime):
+        modified = dates.format_rfc822(modified)
+    if modified:
+        headers["if-modified-since"] = modified
+    return headers
+
+
+def _response_info(
+    response: transports.Response,
+) -> tuple[bytes | None, dict[str, t.Any]]:
+    # The response body is passed to the parser undecoded.
+    # Its encoding is determined by the parser using the HTTP charset (if any),
+    # a byte order mark, or the XML declaration.
+    info: dict[str, t.Any] = {
         "bozo": False,
         "bozo_exception": None,
+        "href": response.url,
+        "status": response.status,
     }
+    if response.headers.get("etag"):
+        info["etag"] = response.headers["etag"]
+    if response.headers.get("last-modified"):
+        info["modified"] = response.headers["last-modified"]
+    if response.status == 304:
+        # The document hasn't changed, so there is nothing to parse.
+        return None, info
+
+    charset = charsets.from_content_type(response.headers.get("content-type", ""))
+    if charset:
+        info["encoding"] = charset
+    return response.content, info
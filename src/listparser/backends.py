@@ -0,0 +1,225 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import abc
+import codecs
+import typing as t
+import xml.parsers.expat
+
+try:
+    import lxml.etree
+except ImportError:
+    lxml = None  # type: ignore[assignment]
+
+from . import charsets, xml_handler
+
+
+class Backend(abc.ABC):
+    """Feed a document to a parser that drives a handler.
+
+    The parser must call the handler's ``start()``, ``end()``,
+    and ``data()`` methods, and the handler must be closed
+    when the backend is closed.
+
+    If the backend only accepts well-formed documents,
+    it raises one of the exceptions in *errors* if the document is malformed,
+    and *recover_with* names the backend used to parse the document again.
+    """
+
+    name: t.ClassVar[str]
+    available: t.ClassVar[bool] = True
+    errors: t.ClassVar[tuple[type[Exception], ...]] = ()
+    recover_with: t.ClassVar[str | None] = None
+
+    def __init__(self, handler: xml_handler.XMLHandler, encoding: str | None) -> None:
+        self.handler = handler
+
+    @abc.abstractmethod
+    def feed(self, chunk: bytes | str) -> None:
+        """Parse the next chunk of the document."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Finish parsing the document and close the handler."""
+
+
+class LxmlXMLBackend(Backend):
+    """Parse well-formed documents using lxml's XML parser."""
+
+    name = "lxml-xml"
+    available = lxml is not None
+    if lxml is not None:
+        errors = (lxml.etree.XMLSyntaxError,)
+    recover_with = "lxml-html"
+
+    def __init__(self, handler: xml_handler.XMLHandler, encoding: str | None) -> None:
+        super().__init__(handler, encoding)
+        self.parser = _lxml_parser(
+            lxml.etree.XMLParser,
+            xml_handler.NamespaceTarget(handler),
+            encoding,
+        )
+
+    def feed(self, chunk: bytes | str) -> None:
+        self.parser.feed(chunk)
+        self._check_namespaces()
+
+    def close(self) -> None:
+        self.parser.close()
+        self._check_namespaces()
+        self.handler.close()
+
+    def _check_namespaces(self) -> None:
+        """Raise an error if an undeclared namespace prefix was found.
+
+        libxml2 doesn't raise errors for undeclared prefixes
+        when a target is used; it removes the prefixes instead.
+        """
+
+        for error in self.parser.feed_error_log:
+            if error.domain == lxml.etree.ErrorDomains.NAMESPACE:
+                raise lxml.etree.XMLSyntaxError(  # type: ignore[call-arg]
+                    error.message, error.type, error.line, error.column
+                )
+
+
+class LxmlHTMLBackend(Backend):
+    """Parse documents using lxml's HTML parser, which recovers from errors."""
+
+    name = "lxml-html"
+    available = lxml is not None
+
+    def __init__(self, handler: xml_handler.XMLHandler, encoding: str | None) -> None:
+        super().__init__(handler, encoding)
+        self.parser = _lxml_parser(
+            lxml.etree.HTMLParser, handler, encoding, recover=True
+        )
+
+    def feed(self, chunk: bytes | str) -> None:
+        self.parser.feed(chunk)
+
+    def close(self) -> None:
+        # lxml closes the handler itself.
+        self.parser.close()
+
+
+class ExpatBackend(Backend):
+    """Parse well-formed documents using Python's built-in expat parser."""
+
+    name = "expat"
+    errors = (xml.parsers.expat.ExpatError, UnicodeError)
+    recover_with = "html.parser"
+
+    def __init__(self, handler: xml_handler.XMLHandler, encoding: str | None) -> None:
+        super().__init__(handler, encoding)
+        # The document is decoded before it is passed to expat,
+        # which only recognizes a few encodings itself.
+        self.decoder = codecs.getincrementaldecoder(encoding or "utf-8")()
+        target = xml_handler.NamespaceTarget(handler)
+        self.parser = xml.parsers.expat.ParserCreate(namespace_separator="}")
+        self.parser.buffer_text = True
+        self.parser.StartElementHandler = target.start
+        self.parser.EndElementHandler = target.end
+        self.parser.CharacterDataHandler = handler.data
+        self.parser.StartNamespaceDeclHandler = target.start_ns
+        self.parser.EndNamespaceDeclHandler = target.end_ns
+
+    def feed(self, chunk: bytes | str) -> None:
+        if isinstance(chunk, bytes):
+            chunk = self.decoder.decode(chunk)
+        self.parser.Parse(chunk, False)
+
+    def close(self) -> None:
+        self.parser.Parse(self.decoder.decode(b"", final=True), True)
+        self.handler.close()
+
+
+class HTMLParserBackend(Backend):
+    """Parse documents using the HTML parser in Python's standard library."""
+
+    name = "html.parser"
+
+    def __init__(self, handler: xml_handler.XMLHandler, encoding: str | None) -> None:
+        super().__init__(handler, encoding)
+        # Like the HTML parser itself, the decoder recovers from errors.
+        # UTF-8 is used if the encoding isn't a recognized text encoding.
+        if encoding is not None:
+            encoding = charsets.normalize(encoding)
+        self.decoder = _replacing_decoder(encoding or "utf-8")
+
+    def feed(self, chunk: bytes | str) -> None:
+        if isinstance(chunk, bytes):
+            chunk = self._decode(chunk)
+        self.handler.feed(chunk)
+
+    def close(self) -> None:
+        self.handler.feed(self._decode(b"", final=True))
+        self.handler.close()
+
+    def _decode(self, chunk: bytes, final: bool = False) -> str:
+        try:
+            return self.decoder.decode(chunk, final)
+        except UnicodeError:
+            # Some decoders raise errors even when they replace invalid bytes,
+            # like the UTF-16 decoder if the document has no byte order mark.
+            self.decoder = _replacing_decoder("utf-8")
+            return self.decoder.decode(chunk, final)
+
+
+def _replacing_decoder(encoding: str) -> codecs.IncrementalDecoder:
+    return codecs.getincrementaldecoder(encoding)(errors="replace")
+
+
+# {name: backend_class}
+registry: dict[str, type[Backend]] = {}
+
+
+def register(backend_class: type[Backend]) -> None:
+    """Make a backend available using its name."""
+
+    registry[backend_class.name] = backend_class
+
+
+for _backend_class in (
+    LxmlXMLBackend,
+    LxmlHTMLBackend,
+    ExpatBackend,
+    HTMLParserBackend,
+):
+    register(_backend_class)
+
+
+def choose(name: str, stream: bool = False) -> type[Backend]:
+    """Return the backend class named *name*.
+
+    If *name* is ``"auto"``, the fastest available backend is chosen.
+    When streaming, only backends that recover from errors are chosen,
+    because objects that were already returned cannot be taken back.
+    """
+
+    if name == "auto":
+        if lxml is not None:
+            name = "lxml-html" if stream else "lxml-xml"
+        else:
+            name = "html.parser" if stream else "expat"  # type: ignore[unreachable]
+
+    try:
+        backend_class = registry[name]
+    except KeyError:
+        raise ValueError(f"{name!r} is not a recognized backend") from None
+    if not backend_class.available:
+        raise ValueError(f"the {name!r} backend is not available")
+    return backend_class
+
+
+def _lxml_parser(
+    parser_class: t.Any, target: t.Any, encoding: str | None, **options: t.Any
+) -> t.Any:
+    try:
+        return parser_class(target=target, encoding=encoding, **options)
+    except LookupError:
+        # libxml2 doesn't recognize every encoding name that Python does.
+        return parser_class(target=target, **options)
@@ -0,0 +1,67 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import typing as t
+
+from . import common
+
+# Pickling SuperDict objects is slow because every attribute lookup
+# that pickle performs goes through `SuperDict.__getattribute__()`.
+# Results are therefore converted to plain dicts, lists, and tuples
+# before they are sent between processes, and converted back afterwards.
+
+# Objects with exactly these keys are packed as tuples of their values.
+object_keys = ("url", "title", "categories", "tags")
+
+
+def pack(result: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Convert a result to plain Python types."""
+
+    packed = _plain(result)
+    for key in common.sections:
+        if key in result:
+            packed[key] = [_pack_object(obj) for obj in result[key]]
+    return packed
+
+
+def unpack(packed: dict[str, t.Any]) -> common.SuperDict:
+    """Convert a packed result back to SuperDict objects."""
+
+    result = _super(packed)
+    for key in common.sections:
+        if key in packed:
+            result[key] = [_unpack_object(obj) for obj in packed[key]]
+    return result
+
+
+def _pack_object(obj: dict[str, t.Any]) -> tuple[t.Any, ...] | dict[str, t.Any]:
+    if tuple(obj) == object_keys:
+        return tuple(obj.values())
+    return _plain(obj)
+
+
+def _unpack_object(obj: tuple[t.Any, ...] | dict[str, t.Any]) -> common.SuperDict:
+    if isinstance(obj, tuple):
+        return common.SuperDict(zip(object_keys, obj))
+    return _super(obj)
+
+
+def _plain(value: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Convert nested SuperDicts to dicts."""
+
+    return {
+        key: _plain(item) if isinstance(item, dict) else item
+        for key, item in value.items()
+    }
+
+
+def _super(value: dict[str, t.Any]) -> common.SuperDict:
+    """Convert nested dicts to SuperDicts."""
+
+    return common.SuperDict(
+        (key, _super(item) if isinstance(item, dict) else item)
+        for key, item in value.items()
+    )
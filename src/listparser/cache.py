@@ -0,0 +1,92 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import typing as t
+
+from . import common
+
+
+class Cache(t.Protocol):
+    """The interface that result caches must implement.
+
+    Results are cached by URL.
+    When a cached result has an ``etag`` or ``modified`` value,
+    :py:func:`listparser.parse` sends a conditional request,
+    and the cached result is returned if the server responds
+    with HTTP status 304 (Not Modified).
+    """
+
+    def get(self, url: str) -> common.SuperDict | None:
+        """Return the cached result for *url*, or None if it is not cached."""
+
+    def set(self, url: str, result: common.SuperDict) -> None:
+        """Cache the result for *url*."""
+
+
+class MemoryCache:
+    """Cache results in memory.
+
+    The least-recently used results are discarded
+    when more than *maxsize* results are cached.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.results: collections.OrderedDict[str, common.SuperDict] = (
+            collections.OrderedDict()
+        )
+
+    def get(self, url: str) -> common.SuperDict | None:
+        try:
+            self.results.move_to_end(url)
+        except KeyError:
+            return None
+        return self.results[url]
+
+    def set(self, url: str, result: common.SuperDict) -> None:
+        self.results[url] = result
+        self.results.move_to_end(url)
+        while len(self.results) > self.maxsize:
+            self.results.popitem(last=False)
+
+
+class FileCache:
+    """Cache results as files in *directory*.
+
+    Results are serialized using pickle,
+    so the directory must not be writable by untrusted users.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = pathlib.Path(directory)
+
+    def _path(self, url: str) -> pathlib.Path:
+        name = hashlib.sha256(url.encode("utf8")).hexdigest()
+        return self.directory / f"{name}.pickle"
+
+    def get(self, url: str) -> common.SuperDict | None:
+        try:
+            with self._path(url).open("rb") as file:
+                result: common.SuperDict = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        return result
+
+    def set(self, url: str, result: common.SuperDict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see a partial file.
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, self._path(url))
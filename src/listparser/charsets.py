@@ -0,0 +1,153 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import codecs
+import email.message
+import re
+
+# The number of bytes needed to find an XML declaration's encoding.
+SNIFF_SIZE = 1024
+
+# Byte order marks and the first characters of an XML declaration
+# in encodings that are not ASCII-compatible.
+# https://www.w3.org/TR/xml/#sec-guessing-no-ext-info
+boms: list[tuple[bytes, str]] = [
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (b"\x00<\x00?", "utf-16be"),
+    (b"<\x00?\x00", "utf-16le"),
+]
+
+_declaration_pattern = re.compile(
+    rb"""
+        ^\s*<\?xml\s[^>]*?
+        encoding\s*=\s*
+        ["'](?P<encoding>[A-Za-z][\w.-]*)["']
+    """,
+    flags=re.VERBOSE,
+)
+
+
+def sniff(prefix: bytes) -> str:
+    """Determine the encoding of an XML document.
+
+    *prefix* should contain at least the first *SNIFF_SIZE* bytes
+    of the document, or the entire document if it is shorter.
+
+    A byte order mark takes precedence over the XML declaration.
+    If neither is present, the XML default of UTF-8 is returned.
+    """
+
+    encoding = from_bom(prefix)
+    if encoding:
+        return encoding
+
+    match = _declaration_pattern.match(prefix)
+    if match:
+        encoding = normalize(match.group("encoding").decode("ascii"))
+        # The declaration was just read as ASCII,
+        # so an encoding that is not ASCII-compatible cannot be true.
+        if encoding and is_ascii_compatible(encoding):
+            return encoding
+
+    return "utf-8"
+
+
+def detect(prefix: bytes, charset: str | None = None) -> str:
+    """Determine the encoding of an XML document with an external *charset*.
+
+    *charset* is typically the charset in an HTTP Content-Type header.
+    A byte order mark takes precedence over it,
+    and it takes precedence over the XML declaration.
+    A charset that is not ASCII-compatible is ignored
+    if the document begins with ``<`` in ASCII, because it cannot be true.
+    """
+
+    encoding = from_bom(prefix)
+    if encoding:
+        return encoding
+
+    if charset and (is_ascii_compatible(charset) or not _starts_with_ascii(prefix)):
+        return charset
+
+    return sniff(prefix)
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """Determine whether *encoding* decodes ASCII bytes as ASCII characters."""
+
+    try:
+        return codecs.decode(b"<?xml", encoding) == "<?xml"
+    except (UnicodeError, LookupError):
+        return False
+
+
+def _starts_with_ascii(prefix: bytes) -> bool:
+    """Determine whether a document begins with ``<`` in ASCII.
+
+    In encodings like UTF-16 and UTF-32, ``<`` is next to a null byte.
+    """
+
+    prefix = prefix.lstrip()
+    return prefix[:1] == b"<" and prefix[1:2] not in (b"", b"\x00")
+
+
+def from_bom(prefix: bytes) -> str | None:
+    """Determine the encoding of an XML document from its first bytes only.
+
+    None is returned if there is no byte order mark
+    and the document does not begin with ``<?`` in UTF-16.
+    """
+
+    for bom, encoding in boms:
+        if prefix.startswith(bom):
+            return encoding
+    return None
+
+
+def from_content_type(content_type: str) -> str | None:
+    """Extract and normalize the charset in a Content-Type header value.
+
+    ..  code-block:: pycon
+
+        >>> from_content_type("application/xml; charset=ISO-8859-1")
+        'iso-8859-1'
+
+    """
+
+    message = email.message.EmailMessage()
+    message["content-type"] = content_type
+    charset = message.get_content_charset()
+    if charset is None:
+        return None
+    return normalize(charset)
+
+
+def normalize(encoding: str) -> str | None:
+    """Lowercase an encoding name, or return None if it is not recognized.
+
+    Codecs that are not text encodings, like ``hex`` and ``zlib``,
+    are not recognized.
+    Python's canonical codec names are not used
+    because lxml does not recognize some of them.
+    """
+
+    encoding = encoding.strip().lower()
+    try:
+        info = codecs.lookup(encoding)
+    except LookupError:
+        return None
+    if not info._is_text_encoding:
+        return None
+    try:
+        # The "undefined" codec is a text encoding that cannot decode anything.
+        info.decode(b"")
+    except UnicodeError:
+        return None
+    return encoding
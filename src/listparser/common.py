@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 
+import collections
 import typing as t
 
+from . import dates
 from .exceptions import ListparserError
 from .xml_handler import XMLHandler
 
@@ -29,15 +31,318 @@ class SuperDict(t.Dict[str, t.Any]):
         return dict.__getattribute__(self, name)
 
 
+# The metadata keys that can be parsed lazily, and the keys they are parsed from.
+lazy_dates = {"created_parsed": "created", "modified_parsed": "modified"}
+
+
+class LazyMeta(SuperDict):
+    """Metadata whose dates are parsed when they are first accessed.
+
+    The ``created_parsed`` and ``modified_parsed`` keys are computed
+    the first time they are looked up, and the parsed values are kept.
+    They do not appear when iterating over the dictionary
+    until they have been accessed.
+    """
+
+    def __missing__(self, key: str) -> t.Any:
+        if _parse_lazy_date(self, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or _parse_lazy_date(self, key)
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        if key in self:
+            return self[key]
+        return default
+
+
+def _parse_lazy_date(meta: LazyMeta, key: object) -> bool:
+    """Parse and store the date for *key*, and return whether it was stored.
+
+    Only ``dict`` methods are used here, because looking up an attribute
+    of *meta* would check whether the attribute name is a key.
+    """
+
+    if not isinstance(key, str):
+        return False
+    source = lazy_dates.get(key)
+    if source is None or not dict.__contains__(meta, source):
+        return False
+    timestamp = dates.parse_date(dict.__getitem__(meta, source))
+    if timestamp is None:
+        return False
+    dict.__setitem__(meta, key, timestamp)
+    return True
+
+
+# The sections of a result that contain feeds, lists, and opportunities.
+sections = ("feeds", "lists", "opportunities")
+
+# The fields that can be selected in each section of the result.
+object_fields = frozenset({"url", "title", "categories", "tags"})
+meta_fields = frozenset({"title", "author", "created", "modified"})
+fields = dict.fromkeys(sections, object_fields)
+fields["meta"] = meta_fields
+
+
+def parse_fields(only: t.Iterable[str]) -> dict[str, frozenset[str]]:
+    """Convert names like "feeds" and "feeds.url" to {section: {field, ...}}.
+
+    Feed, list, and opportunity URLs are always included.
+    """
+
+    if isinstance(only, str):
+        only = [only]
+    wanted: dict[str, set[str]] = {}
+    for name in only:
+        section, _, field = name.partition(".")
+        if section not in fields or (field and field not in fields[section]):
+            message = f"{name!r} is not a recognized field"
+            raise ValueError(message)
+        wanted.setdefault(section, set()).update([field] if field else fields[section])
+        if section != "meta":
+            wanted[section].add("url")
+    return {section: frozenset(names) for section, names in wanted.items()}
+
+
+class CategoryPath:
+    """A category path, interned in a tree of category paths.
+
+    Each distinct path is represented by a single node,
+    so objects in the same category share a single list of names.
+    The list is only built when it is first needed.
+    """
+
+    __slots__ = ("parent", "name", "children", "names")
+
+    def __init__(self, parent: CategoryPath | None = None, name: str = "") -> None:
+        self.parent = parent
+        self.name = name
+        self.children: dict[str, CategoryPath] = {}
+        self.names: list[str] | None = None
+
+    def child(self, name: str) -> CategoryPath:
+        """Return the node for the path extended by *name*."""
+
+        try:
+            return self.children[name]
+        except KeyError:
+            node = self.children[name] = CategoryPath(self, name)
+            return node
+
+    def as_list(self) -> list[str]:
+        """Return the path as a list of names.
+
+        The same list is returned every time, so it must not be modified.
+        """
+
+        if self.names is None:
+            # The names are collected from the parent links, starting here,
+            # until an ancestor whose list was already built is reached.
+            # Lists are only kept for the paths that were requested.
+            reversed_names = []
+            node = self
+            while node.parent is not None and node.names is None:
+                reversed_names.append(node.name)
+                node = node.parent
+            reversed_names.reverse()
+            self.names = (node.names or []) + reversed_names
+        return self.names
+
+
+class Hierarchy:
+    """The names of the groups containing the current element.
+
+    Names are pushed and popped like a list, and the current path
+    is tracked as a :py:class:`CategoryPath` without copying any names.
+
+    If a *tree* folder is given, a folder is added to the tree
+    for each non-empty name, and objects can be added to the current folder.
+    """
+
+    def __init__(self, tree: SuperDict | None = None) -> None:
+        self.root = CategoryPath()
+        self.nodes = [self.root]
+
+        # *folders* is only set when building a folder tree.
+        self.folders: list[SuperDict] | None = None
+        # found_in_folders = {(id(folder), url), ...}
+        self.found_in_folders: set[tuple[int, str]] = set()
+        if tree is not None:
+            self.folders = [tree]
+
+    def __len__(self) -> int:
+        return len(self.nodes) - 1
+
+    def append(self, name: str) -> None:
+        self.nodes.append(self.nodes[-1].child(name))
+        if self.folders is not None:
+            folder = self.folders[-1]
+            if name:
+                folder = new_folder(name)
+                self.folders[-1]["children"].append(folder)
+            self.folders.append(folder)
+
+    def pop(self) -> str:
+        if self.folders is not None:
+            self.folders.pop()
+        return self.nodes.pop().name
+
+    @property
+    def path(self) -> CategoryPath:
+        """The current path."""
+
+        return self.nodes[-1]
+
+    def lookup(self, names: list[str]) -> CategoryPath:
+        """Return the interned path for *names*."""
+
+        node = self.root
+        for name in names:
+            node = node.child(name)
+        return node
+
+    def add_to_folder(self, key: str, obj: t.Any) -> None:
+        """Add *obj* to the current folder, if a folder tree is being built."""
+
+        if self.folders is None:
+            return
+        folder = self.folders[-1]
+        found = (id(folder), entry_fields(obj)[0])
+        if found not in self.found_in_folders:
+            self.found_in_folders.add(found)
+            folder[key].append(obj)
+
+
+def entry_fields(obj: t.Any) -> tuple[str, list[list[str]], list[str]]:
+    """Return the URL, categories, and tags of a dictionary or slotted object."""
+
+    if isinstance(obj, dict):
+        return obj["url"], obj["categories"], obj["tags"]
+    return obj.url, obj.categories, obj.tags
+
+
+def new_folder(title: str = "") -> SuperDict:
+    """Create an empty folder for the folder tree."""
+
+    return SuperDict(
+        title=title,
+        children=[],
+        feeds=[],
+        lists=[],
+        opportunities=[],
+    )
+
+
 class Common(XMLHandler):
     def __init__(self) -> None:
         super().__init__()
         self.harvest: dict[str, t.Any] = {}
-        self.hierarchy: list[str] = []
+        self.hierarchy = Hierarchy()
         self.flag_feed = False
 
         # found_urls = {url: (append_to_key, obj)}
-        self.found_urls: dict[str, tuple[str, SuperDict]] = {}
+        # The objects are dictionaries, or slotted objects once published.
+        self.found_urls: dict[str, tuple[str, t.Any]] = {}
+        # *keep_attributes* is True, False, or a set of attribute names.
+        self.keep_attributes: bool | frozenset[str] = False
+
+        # wanted = {section: {field, ...}}
+        # Sections and fields that are not wanted are not extracted.
+        self.wanted: dict[str, frozenset[str]] = dict(fields)
+
+        # found_categories = {url: {category_path, ...}}
+        self.found_categories: dict[str, set[CategoryPath]] = {}
+
+        # *events* is only set when streaming results to the caller.
+        # When set, objects are queued here instead of in the harvest.
+        self.events: collections.deque[tuple[str, t.Any]] | None = None
+        self.flag_meta_emitted = False
+
+        # If *entry_types* is set, objects are converted to these classes
+        # when they are published, so only one copy of each object exists.
+        # entry_types = {append_to_key: class}
+        self.entry_types: dict[str, t.Callable[..., t.Any]] | None = None
+
+        # If *flag_lazy_dates* is set, dates are parsed when they are accessed.
+        # The metadata must be a LazyMeta dictionary.
+        self.flag_lazy_dates = False
+
+    def emit(self, key: str, obj: SuperDict) -> t.Any:
+        """Publish a new feed, list, or opportunity object.
+
+        The published object is returned.
+        If *entry_types* is set, it is a slotted copy of *obj*,
+        which replaces *obj* in *found_urls*.
+        """
+
+        published: t.Any = obj
+        if self.entry_types is not None:
+            published = self.entry_types[key](
+                obj["url"],
+                obj["title"],
+                obj["categories"],
+                obj["tags"],
+                obj.get("attributes"),
+            )
+            self.found_urls[obj["url"]] = (key, published)
+
+        if self.events is not None:
+            self.events.append((key, published))
+        else:
+            self.harvest[key].append(published)
+        return published
+
+    def emit_meta(self) -> None:
+        """Publish the metadata if it hasn't been published already.
+
+        This only has an effect when streaming results to the caller.
+        """
+
+        if self.events is not None and not self.flag_meta_emitted:
+            self.flag_meta_emitted = True
+            self.events.append(("meta", self.harvest["meta"]))
+
+    def set_fields(self, wanted: dict[str, frozenset[str]]) -> None:
+        """Extract only the *wanted* sections and fields of the result."""
+
+        self.wanted = wanted
+
+    def add_category(self, obj: t.Any, category: CategoryPath) -> None:
+        """Add *category* to an object if it isn't already present.
+
+        Single-level categories are also added to the object's tags.
+        The categories of each object are indexed in a set,
+        so objects found in many places don't require searching a long list.
+        """
+
+        url, categories, tags = entry_fields(obj)
+        index = self.found_categories.setdefault(url, set())
+        if category in index:
+            return
+        index.add(category)
+        names = category.as_list()
+        categories.append(names)
+        if len(names) == 1:
+            tags.append(names[0])
+
+    def store_attributes(self, obj: SuperDict, attrs: dict[str, str]) -> None:
+        """Store the attributes of the element that described an object.
+
+        The attributes dictionary is created anew for each element,
+        so it is stored as-is unless only some attributes are wanted.
+        """
+
+        if self.keep_attributes is True:
+            obj["attributes"] = attrs
+        elif self.keep_attributes:
+            obj["attributes"] = {
+                key: value
+                for key, value in attrs.items()
+                if key in self.keep_attributes
+            }
 
     def raise_bozo(self, error: str) -> None:
         self.harvest["bozo"] = True
@@ -63,6 +368,10 @@ class Common(XMLHandler):
 
     def close(self) -> None:
         super().close()
-        self.hierarchy = []
+        # Documents without an OPML <head> must still publish their metadata.
+        self.emit_meta()
+        self.flag_meta_emitted = False
+        self.hierarchy = Hierarchy()
         self.flag_feed = False
         self.found_urls = {}
+        self.found_categories = {}
@@ -4,8 +4,16 @@
 
 from __future__ import annotations
 
+import array
 import datetime
+import email.utils
+import functools
+import math
 import re
+import typing as t
+
+# The number of distinct timestamps whose parsed values are cached.
+CACHE_SIZE = 4096
 
 months: dict[str, int] = {
     "jan": 1,
@@ -165,9 +173,7 @@ def parse_rfc822(date: str) -> datetime.datetime | None:
             hour,
             minute,
             second,
-            tzinfo=datetime.timezone(
-                datetime.timedelta(minutes=(tz_hour * 60) + tz_min)
-            ),
+            tzinfo=_timezone((tz_hour * 60) + tz_min),
         )
     except (ValueError, OverflowError):
         return None
@@ -188,16 +194,19 @@ _rfc3339_pattern = re.compile(
 
 
 def parse_rfc3339(date: str) -> datetime.datetime | None:
-    """Parse RFC 3339 dates and times.
-
-    `datetime.datetime.fromisoformat()` can be used
-    once Python 3.10 and lower are no longer supported.
-    """
+    """Parse RFC 3339 dates and times."""
 
     match = _rfc3339_pattern.match(date)
     if not match:
         return None
 
+    # In Python 3.11 and higher, `datetime.datetime.fromisoformat()`
+    # parses every valid timestamp that the pattern matches.
+    try:
+        return datetime.datetime.fromisoformat(date)
+    except ValueError:
+        pass
+
     year = int(match.group("year"))
     month = int(match.group("month"))
     day = int(match.group("day"))
@@ -221,9 +230,8 @@ def parse_rfc3339(date: str) -> datetime.datetime | None:
             sign = 1 if timezone[0] == "+" else -1
             tz_hour = int(timezone[1:3])
             tz_minute = int(timezone[-2:])
-            offset = datetime.timedelta(minutes=sign * ((tz_hour * 60) + tz_minute))
             try:
-                tzinfo = datetime.timezone(offset)
+                tzinfo = _timezone(sign * ((tz_hour * 60) + tz_minute))
             except ValueError:
                 return None
 
@@ -234,3 +242,114 @@ def parse_rfc3339(date: str) -> datetime.datetime | None:
         )
     except (ValueError, OverflowError):
         return None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_date(date: str) -> datetime.datetime | None:
+    """Parse RFC 822 and RFC 3339 dates and times.
+
+    RFC 3339 timestamps begin with a four-digit year and a hyphen,
+    which RFC 822 timestamps never do, so only one format is tried.
+
+    The results are cached, because the same timestamps tend to recur
+    when many subscription lists are parsed.
+    The datetime objects are therefore shared, but they are immutable.
+    """
+
+    if date[4:5] == "-" and date[:4].isdigit():
+        return parse_rfc3339(date)
+    return parse_rfc822(date)
+
+
+def parse_many(dates: t.Iterable[str]) -> list[datetime.datetime | None]:
+    """Parse many RFC 822 and RFC 3339 dates and times.
+
+    This returns the same values as calling :py:func:`parse_date`
+    for each timestamp, but it is faster for large numbers of timestamps.
+    Each distinct timestamp is parsed once,
+    and the timestamps are grouped by format so that each group
+    is parsed in a single loop.
+    """
+
+    dates = list(dates)
+    parsed = _parse_distinct(dates)
+    return [parsed[date] for date in dates]
+
+
+def _parse_distinct(dates: list[str]) -> dict[str, datetime.datetime | None]:
+    """Parse each distinct timestamp in *dates* once."""
+
+    rfc3339: list[str] = []
+    rfc822: list[str] = []
+    for date in dict.fromkeys(dates):
+        if date[4:5] == "-" and date[:4].isdigit():
+            rfc3339.append(date)
+        else:
+            rfc822.append(date)
+
+    parsed: dict[str, datetime.datetime | None] = {}
+    match = _rfc3339_pattern.match
+    fromisoformat = datetime.datetime.fromisoformat
+    for date in rfc3339:
+        if not match(date):
+            parsed[date] = None
+            continue
+        try:
+            parsed[date] = fromisoformat(date)
+        except ValueError:
+            parsed[date] = parse_rfc3339(date)
+    for date in rfc822:
+        parsed[date] = parse_rfc822(date)
+    return parsed
+
+
+_epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_naive_epoch = _epoch.replace(tzinfo=None)
+
+
+def parse_many_epoch(dates: t.Iterable[str]) -> array.array[float]:
+    """Parse many dates and times into seconds since the Unix epoch.
+
+    The timestamps are parsed by :py:func:`parse_many`.
+    Timestamps without a timezone are assumed to be in UTC,
+    and timestamps that cannot be parsed are returned as NaN.
+
+    The array supports the buffer protocol,
+    so it can be wrapped by ``numpy.frombuffer()`` without copying it.
+    """
+
+    dates = list(dates)
+    seconds: dict[str, float] = {}
+    for key, date in _parse_distinct(dates).items():
+        if date is None:
+            seconds[key] = math.nan
+        elif date.tzinfo is None:
+            seconds[key] = (date - _naive_epoch).total_seconds()
+        else:
+            seconds[key] = (date - _epoch).total_seconds()
+    return array.array("d", [seconds[date] for date in dates])
+
+
+@functools.lru_cache(maxsize=None)
+def _timezone(minutes: int) -> datetime.timezone:
+    """Return a timezone that is *minutes* ahead of UTC.
+
+    Timezones are cached so that timestamps with the same offset share them.
+    There are fewer than 3,000 valid offsets.
+    """
+
+    return datetime.timezone(datetime.timedelta(minutes=minutes))
+
+
+def format_rfc822(date: datetime.datetime) -> str:
+    """Format a datetime as an RFC 822 date and time in GMT.
+
+    This is the format used by HTTP and OPML.
+    Naive datetimes are assumed to be in UTC.
+    """
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return email.utils.format_datetime(
+        date.astimezone(datetime.timezone.utc), usegmt=True
+    )
@@ -0,0 +1,153 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import array
+import hashlib
+import typing as t
+import urllib.parse
+
+from . import common
+
+default_ports = {"http": 80, "https": 443}
+
+
+def canonicalize(url: str) -> str:
+    """Return a canonical form of *url* so that equivalent URLs compare equal.
+
+    ``feed:`` URLs are converted to HTTP URLs.
+    For HTTP and HTTPS URLs, the scheme and host are lowercased,
+    default ports, trailing slashes, and fragments are removed,
+    and an empty path becomes ``/``.
+    Other URLs are returned without changes.
+
+    ..  code-block:: pycon
+
+        >>> canonicalize("feed://Example.COM:80/rss/#top")
+        'http://example.com/rss'
+
+    """
+
+    url = url.strip()
+    if url[:5].lower() == "feed:":
+        url = url[5:]
+        if url[:2] == "//":
+            url = url[2:]
+        if not url[:8].lower().startswith(("http://", "https://")):
+            url = f"http://{url}"
+
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in default_ports:
+        return url
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+
+    userinfo, at, host = parts.netloc.rpartition("@")
+    host = host.lower()
+    if port is not None:
+        host = host[: host.rindex(":")]
+        if port != default_ports[scheme]:
+            host = f"{host}:{port}"
+    host = host.rstrip(":")
+    path = parts.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit(
+        (scheme, f"{userinfo}{at}{host}", path, parts.query, "")
+    )
+
+
+class FeedIndex:
+    """Remember the URLs found in many documents to find duplicates.
+
+    URLs are passed to *canonicalize* before they are indexed,
+    so equivalent URLs are recognized as duplicates.
+    If *canonicalize* is None, only identical URLs are duplicates.
+
+    Only a 64-bit hash of each URL is kept, in a flat array,
+    so millions of URLs can be indexed using little memory.
+    Hashes are stable across processes, so the index can be pickled
+    and reused later.
+
+    Pass the index to :py:func:`listparser.parse`
+    or :py:func:`listparser.parse_many` to index each document's URLs
+    and report which of them were new; see :doc:`/reference/deduplication`.
+    """
+
+    def __init__(
+        self, canonicalize: t.Callable[[str], str] | None = canonicalize
+    ) -> None:
+        self.canonicalize = canonicalize
+        # *table* is an open-addressed hash table. 0 marks an empty slot.
+        self.table = array.array("Q", bytes(8 * 8))
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, url: object) -> bool:
+        if not isinstance(url, str):
+            return False
+        key = self._key(url)
+        return self.table[self._slot(key)] == key
+
+    def add(self, url: str) -> bool:
+        """Add *url* to the index, and return whether it was new."""
+
+        key = self._key(url)
+        slot = self._slot(key)
+        if self.table[slot] == key:
+            return False
+        self.table[slot] = key
+        self.count += 1
+        # The table is kept at most two-thirds full.
+        if self.count * 3 >= len(self.table) * 2:
+            self._grow()
+        return True
+
+    def add_result(self, result: common.SuperDict) -> common.SuperDict:
+        """Add the URLs in a parse result to the index.
+
+        A dictionary with ``new`` and ``duplicates`` keys is returned.
+        Each contains ``feeds``, ``lists``, and ``opportunities`` lists
+        of the objects in *result* whose URLs were or were not new.
+        """
+
+        report = common.SuperDict(new=common.SuperDict(), duplicates=common.SuperDict())
+        for section in common.sections:
+            new = report["new"][section] = []
+            duplicates = report["duplicates"][section] = []
+            for obj in result[section]:
+                if self.add(obj.url):
+                    new.append(obj)
+                else:
+                    duplicates.append(obj)
+        return report
+
+    def _key(self, url: str) -> int:
+        if self.canonicalize is not None:
+            url = self.canonicalize(url)
+        digest = hashlib.blake2b(
+            url.encode("utf8", "surrogatepass"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def _slot(self, key: int) -> int:
+        """Return the slot that holds *key*, or the empty slot where it belongs."""
+
+        table = self.table
+        mask = len(table) - 1
+        slot = key & mask
+        while table[slot] and table[slot] != key:
+            slot = (slot + 1) & mask
+        return slot
+
+    def _grow(self) -> None:
+        old_table = self.table
+        self.table = array.array("Q", bytes(16 * len(old_table)))
+        for key in old_table:
+            if key:
+                self.table[self._slot(key)] = key
@@ -5,3 +5,7 @@
 
 class ListparserError(Exception):
     pass
+
+
+class LimitExceededError(ListparserError):
+    """A document exceeded a limit on its size or parsing time."""
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import copy
 import typing as t
 
 from . import common
@@ -65,13 +64,19 @@ class FoafMixin(common.Common):
         else:
             title = ""
         for url in self.agent_feeds:
-            obj = common.SuperDict({"url": url, "title": title})
+            obj = common.SuperDict(
+                {"url": url, "title": title, "categories": [], "tags": []}
+            )
             self.group_objs.append(("feeds", obj))
         for url in self.agent_lists:
-            obj = common.SuperDict({"url": url, "title": title})
+            obj = common.SuperDict(
+                {"url": url, "title": title, "categories": [], "tags": []}
+            )
             self.group_objs.append(("lists", obj))
         for url in self.agent_opps:
-            obj = common.SuperDict({"url": url, "title": title})
+            obj = common.SuperDict(
+                {"url": url, "title": title, "categories": [], "tags": []}
+            )
             self.group_objs.append(("opportunities", obj))
 
     def start_foaf_agent(self, _: t.Any) -> None:
@@ -111,19 +116,25 @@ class FoafMixin(common.Common):
     def end_foaf_group(self) -> None:
         self.flag_group = False
         for key, obj in self.group_objs:
+            if key not in self.wanted:
+                continue
+            if "title" not in self.wanted[key]:
+                obj["title"] = ""
+            is_new = False
+            url = obj["url"]
             # Check for duplicates
-            if obj["url"] in self.found_urls:
-                obj = self.found_urls[obj["url"]][1]
+            if url in self.found_urls:
+                obj = self.found_urls[url][1]
             else:
-                self.found_urls[obj["url"]] = (key, obj)
-                self.harvest[key].append(obj)
-            # Create or consolidate categories and tags
-            obj.setdefault("categories", [])
-            obj.setdefault("tags", [])
-            if self.hierarchy and self.hierarchy not in obj["categories"]:
-                obj["categories"].append(copy.copy(self.hierarchy))
-            if len(self.hierarchy) == 1 and self.hierarchy[0] not in obj["tags"]:
-                obj["tags"].extend(copy.copy(self.hierarchy))
+                self.found_urls[url] = (key, obj)
+                is_new = True
+            # Consolidate categories and tags
+            flag_categories = {"categories", "tags"} & self.wanted[key]
+            if self.hierarchy and flag_categories:
+                self.add_category(obj, self.hierarchy.path)
+            if is_new:
+                obj = self.emit(key, obj)
+            self.hierarchy.add_to_folder(self.found_urls[url][0], obj)
         self.group_objs = []
         # Maintain the hierarchy
         if self.hierarchy:
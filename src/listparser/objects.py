@@ -0,0 +1,242 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import datetime
+
+from . import common
+
+
+class Entry:
+    """A feed, subscription list, or opportunity.
+
+    Entries use ``__slots__``, so they use less memory than dictionaries
+    and their attributes can be accessed quickly.
+
+    *attributes* is None unless outline attributes were kept.
+    """
+
+    __slots__ = ("url", "title", "categories", "tags", "attributes")
+
+    url: str
+    title: str
+    categories: list[list[str]]
+    tags: list[str]
+    attributes: dict[str, str] | None
+
+    def __init__(
+        self,
+        url: str,
+        title: str = "",
+        categories: list[list[str]] | None = None,
+        tags: list[str] | None = None,
+        attributes: dict[str, str] | None = None,
+    ) -> None:
+        self.url = url
+        self.title = title
+        self.categories = categories if categories is not None else []
+        self.tags = tags if tags is not None else []
+        self.attributes = attributes
+
+    def to_dict(self) -> common.SuperDict:
+        """Return the entry as a dictionary, as returned by default."""
+
+        result = common.SuperDict(
+            url=self.url,
+            title=self.title,
+            categories=self.categories,
+            tags=self.tags,
+        )
+        if self.attributes is not None:
+            result["attributes"] = self.attributes
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Entry) or type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(url={self.url!r}, title={self.title!r})"
+
+
+class Feed(Entry):
+    """A feed."""
+
+    __slots__ = ()
+
+
+class SubscriptionList(Entry):
+    """A subscription list."""
+
+    __slots__ = ()
+
+
+class Opportunity(Entry):
+    """A webpage that may have a feed."""
+
+    __slots__ = ()
+
+
+class Author:
+    """The author of a subscription list.
+
+    Attributes that were not found in the document are None.
+    """
+
+    __slots__ = ("name", "email", "url")
+
+    name: str | None
+    email: str | None
+    url: str | None
+
+    def __init__(
+        self,
+        name: str | None = None,
+        email: str | None = None,
+        url: str | None = None,
+    ) -> None:
+        self.name = name
+        self.email = email
+        self.url = url
+
+    def to_dict(self) -> common.SuperDict:
+        """Return the author as a dictionary, as returned by default."""
+
+        return _present(self, self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Author):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Author(name={self.name!r})"
+
+
+class Meta:
+    """Information about a subscription list.
+
+    Attributes that were not found in the document are None.
+    """
+
+    __slots__ = (
+        "title",
+        "author",
+        "created",
+        "created_parsed",
+        "modified",
+        "modified_parsed",
+    )
+
+    title: str | None
+    author: Author | None
+    created: str | None
+    created_parsed: datetime.datetime | None
+    modified: str | None
+    modified_parsed: datetime.datetime | None
+
+    def __init__(
+        self,
+        title: str | None = None,
+        author: Author | None = None,
+        created: str | None = None,
+        created_parsed: datetime.datetime | None = None,
+        modified: str | None = None,
+        modified_parsed: datetime.datetime | None = None,
+    ) -> None:
+        self.title = title
+        self.author = author
+        self.created = created
+        self.created_parsed = created_parsed
+        self.modified = modified
+        self.modified_parsed = modified_parsed
+
+    def to_dict(self) -> common.SuperDict:
+        """Return the metadata as a dictionary, as returned by default."""
+
+        result = _present(self, self.__slots__)
+        if self.author is not None:
+            result["author"] = self.author.to_dict()
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Meta):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Meta(title={self.title!r})"
+
+
+entry_types: dict[str, type[Entry]] = {
+    "feeds": Feed,
+    "lists": SubscriptionList,
+    "opportunities": Opportunity,
+}
+
+
+def from_result(result: common.SuperDict) -> common.SuperDict:
+    """Return a copy of *result* that uses slotted objects.
+
+    The feeds, lists, and opportunities become :py:class:`Entry` objects,
+    and the metadata becomes a :py:class:`Meta` object.
+    Folders in the ``tree`` key, if present, refer to the new objects.
+    Entries that are already slotted objects are reused.
+    """
+
+    converted = common.SuperDict(result)
+    # entries = {id(obj): entry}
+    entries: dict[int, Entry] = {}
+    for key, cls in entry_types.items():
+        converted[key] = []
+        for obj in result[key]:
+            if isinstance(obj, Entry):
+                entry = obj
+            else:
+                entry = cls(
+                    obj["url"],
+                    obj["title"],
+                    obj["categories"],
+                    obj["tags"],
+                    obj.get("attributes"),
+                )
+            entries[id(obj)] = entry
+            converted[key].append(entry)
+    if "tree" in result:
+        converted["tree"] = _convert_folder(result["tree"], entries)
+    meta = dict(result["meta"])
+    # Dates that are parsed lazily are not copied until they are accessed.
+    for key in common.lazy_dates:
+        value = result["meta"].get(key)
+        if value is not None:
+            meta[key] = value
+    if "author" in meta:
+        meta["author"] = Author(**meta["author"])
+    converted["meta"] = Meta(**meta)
+    return converted
+
+
+def _convert_folder(
+    folder: common.SuperDict, entries: dict[int, Entry]
+) -> common.SuperDict:
+    """Make a copy of *folder* that refers to slotted objects."""
+
+    converted = common.SuperDict(folder)
+    converted["children"] = [
+        _convert_folder(child, entries) for child in folder["children"]
+    ]
+    for key in common.sections:
+        converted[key] = [entries[id(obj)] for obj in folder[key]]
+    return converted
+
+
+def _present(obj: object, names: tuple[str, ...]) -> common.SuperDict:
+    """Return the attributes of *obj* that are not None."""
+
+    values = ((name, getattr(obj, name)) for name in names)
+    return common.SuperDict(
+        (name, value) for name, value in values if value is not None
+    )
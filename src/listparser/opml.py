@@ -4,12 +4,31 @@
 
 from __future__ import annotations
 
-import copy
-
 from . import common, dates
 
+# The OPML <head> elements that provide each metadata field.
+meta_elements = {
+    "title": ("title",),
+    "author": ("ownerid", "owneremail", "ownername"),
+    "created": ("datecreated",),
+    "modified": ("datemodified",),
+}
+
 
 class OpmlMixin(common.Common):
+    def set_fields(self, wanted: dict[str, frozenset[str]]) -> None:
+        super().set_fields(wanted)
+
+        # Handlers for unwanted metadata elements are disabled
+        # so that their text is never captured and their dates never parsed.
+        self.disable_handlers(
+            (prefix, name)
+            for field, names in meta_elements.items()
+            if field not in wanted.get("meta", ())
+            for name in names
+            for prefix in ("", "opml")
+        )
+
     def start_opml_opml(self, attrs: dict[str, str]) -> None:
         self.harvest["version"] = "opml"
         if attrs.get("version") in ("1.0", "1.1"):
@@ -18,6 +37,8 @@ class OpmlMixin(common.Common):
             self.harvest["version"] = "opml2"
 
     def start_opml_outline(self, attrs: dict[str, str]) -> None:
+        self.emit_meta()
+
         # Find an appropriate title in @text or @title (else empty)
         if attrs.get("text", "").strip():
             title = attrs["text"].strip()
@@ -47,36 +68,51 @@ class OpmlMixin(common.Common):
         if not url and "htmlurl" in attrs:
             url = attrs["htmlurl"].strip()
             append_to = "opportunities"
-        if not url:
+        wanted = self.wanted.get(append_to or "")
+        if not url or wanted is None:
             # Maintain the hierarchy
             self.hierarchy.append("")
             return
+        if "title" not in wanted:
+            title = ""
+        # Categories and tags are built together.
+        flag_categories = "categories" in wanted or "tags" in wanted
+        new_key = None
         if url not in self.found_urls and append_to:
             # This is a brand-new URL
-            obj = common.SuperDict({"url": url, "title": title})
+            obj = common.SuperDict(
+                {"url": url, "title": title, "categories": [], "tags": []}
+            )
             self.found_urls[url] = (append_to, obj)
-            self.harvest[append_to].append(obj)
+            self.store_attributes(obj, attrs)
+            new_key = append_to
         else:
             obj = self.found_urls[url][1]
 
         # Handle categories and tags
-        obj.setdefault("categories", [])
-        if "category" in attrs.keys():
+        if "category" in attrs.keys() and flag_categories:
             for i in attrs["category"].split(","):
                 tmp = [j.strip() for j in i.split("/") if j.strip()]
-                if tmp and tmp not in obj["categories"]:
-                    obj["categories"].append(tmp)
-        # Copy the current hierarchy into `categories`
-        if self.hierarchy and self.hierarchy not in obj["categories"]:
-            obj["categories"].append(copy.copy(self.hierarchy))
-        # Copy all single-element `categories` into `tags`
-        obj["tags"] = [i[0] for i in obj["categories"] if len(i) == 1]
+                if tmp:
+                    self.add_category(obj, self.hierarchy.lookup(tmp))
+        # Add the current hierarchy to `categories`
+        if self.hierarchy and flag_categories:
+            self.add_category(obj, self.hierarchy.path)
+
+        # The categories and tags are now complete, so publish new objects.
+        if new_key is not None:
+            obj = self.emit(new_key, obj)
+        self.hierarchy.add_to_folder(self.found_urls[url][0], obj)
 
         self.hierarchy.append("")
 
     def end_opml_outline(self) -> None:
         self.hierarchy.pop()
 
+    # lxml's HTML parser may not report the end of the OPML <head>,
+    # so the metadata is also published when the first outline is found.
+    end_opml_head = common.Common.emit_meta
+
     start_opml_title = common.Common.expect_text
 
     def end_opml_title(self) -> None:
@@ -114,7 +150,9 @@ class OpmlMixin(common.Common):
         value = self.get_text()
         if value:
             self.harvest["meta"]["created"] = value
-            timestamp = dates.parse_rfc822(value) or dates.parse_rfc3339(value)
+            if self.flag_lazy_dates:
+                return
+            timestamp = dates.parse_date(value)
             if timestamp:
                 self.harvest["meta"]["created_parsed"] = timestamp
             else:
@@ -126,7 +164,9 @@ class OpmlMixin(common.Common):
         value = self.get_text()
         if value:
             self.harvest["meta"]["modified"] = value
-            timestamp = dates.parse_rfc822(value) or dates.parse_rfc3339(value)
+            if self.flag_lazy_dates:
+                return
+            timestamp = dates.parse_date(value)
             if timestamp:
                 self.harvest["meta"]["modified_parsed"] = timestamp
             else:
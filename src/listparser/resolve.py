@@ -0,0 +1,179 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import concurrent.futures
+import copy
+import typing as t
+import urllib.parse
+
+from . import common
+
+# The number of subscription lists that are retrieved at the same time.
+WORKERS = 10
+
+
+def resolve_lists(
+    result: common.SuperDict,
+    fetch: t.Callable[[str], common.SuperDict],
+    max_depth: int,
+    wanted: dict[str, frozenset[str]] | None = None,
+) -> common.SuperDict:
+    """Retrieve the subscription lists in *result* and merge their contents.
+
+    *fetch* is called with the URL of each subscription list.
+    Lists are retrieved breadth-first, level by level, so each URL
+    is retrieved only once, at the smallest depth at which it is referenced.
+
+    If *wanted* is given, the sections and fields that are not wanted
+    are emptied in the merged result.
+    The subscription lists must still be extracted from each document
+    so that they can be retrieved.
+
+    A copy of *result* is returned; *result* itself is not modified.
+    """
+
+    root_url = result.get("href")
+    nodes: dict[str, common.SuperDict] = {}
+    results: dict[str, common.SuperDict] = {}
+    if root_url:
+        nodes[root_url] = _node(0, result)
+        results[root_url] = result
+
+    seen = set(nodes)
+    level = [(root_url, result)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        for depth in range(1, max_depth + 1):
+            urls = []
+            for base, parent in level:
+                for obj in parent["lists"]:
+                    url = _absolute(base, obj["url"])
+                    if url not in seen:
+                        seen.add(url)
+                        urls.append(url)
+            level = []
+            for url, child in zip(urls, pool.map(fetch, urls)):
+                nodes[url] = _node(depth, child)
+                results[url] = child
+                level.append((child.get("href") or url, child))
+
+    # The folder tree, if present, must refer to the copied objects.
+    memo: dict[int, t.Any] = {}
+    merged = common.SuperDict(result)
+    # found = {url: (obj, {category, ...})}
+    # The categories of each object are indexed in a set,
+    # so merging categories doesn't require searching a long list.
+    found: dict[str, tuple[common.SuperDict, set[tuple[str, ...]]]] = {}
+    for key in common.sections:
+        merged[key] = [copy.deepcopy(obj, memo) for obj in result[key]]
+        for obj in merged[key]:
+            index = {tuple(category) for category in obj["categories"]}
+            found.setdefault(obj["url"], (obj, index))
+    if "tree" in result:
+        merged["tree"] = copy.deepcopy(result["tree"], memo)
+
+    def merge(
+        base: str | None,
+        document: common.SuperDict,
+        prefixes: list[list[str]],
+        path: list[str | None],
+    ) -> None:
+        if len(path) > 1:
+            for key in common.sections:
+                for obj in document[key]:
+                    url = obj["url"]
+                    if key == "lists":
+                        url = _absolute(base, url)
+                    _add(merged[key], found, url, obj, prefixes)
+
+        for obj in document["lists"]:
+            url = _absolute(base, obj["url"])
+            if url in path:
+                nodes[url]["cycle"] = True
+            elif url in results and len(path) <= max_depth:
+                child = results[url]
+                paths = _prefix(prefixes, obj["categories"], obj["title"])
+                merge(child.get("href") or url, child, paths or [[]], path + [url])
+
+    merge(root_url, result, [[]], [root_url])
+    if wanted is not None:
+        _select(merged, wanted)
+    merged["resolved"] = nodes
+    return merged
+
+
+def _select(result: common.SuperDict, wanted: dict[str, frozenset[str]]) -> None:
+    """Empty the sections and fields of a merged result that are not *wanted*."""
+
+    for key in common.sections:
+        fields = wanted.get(key)
+        if fields is None:
+            result[key] = []
+            if "tree" in result:
+                folders = [result["tree"]]
+                while folders:
+                    folder = folders.pop()
+                    folder[key] = []
+                    folders.extend(folder["children"])
+            continue
+        for obj in result[key]:
+            if "title" not in fields:
+                obj["title"] = ""
+            # Categories and tags are extracted together.
+            if "categories" not in fields and "tags" not in fields:
+                obj["categories"] = []
+                obj["tags"] = []
+
+
+def _node(depth: int, result: common.SuperDict) -> common.SuperDict:
+    return common.SuperDict(
+        depth=depth,
+        bozo=result.get("bozo", False),
+        bozo_exception=result.get("bozo_exception"),
+        cycle=False,
+    )
+
+
+def _absolute(base: str | None, url: str) -> str:
+    if base:
+        return urllib.parse.urljoin(base, url)
+    return url
+
+
+def _prefix(
+    prefixes: list[list[str]], categories: list[list[str]], title: str = ""
+) -> list[list[str]]:
+    """Prepend each of *prefixes* to each of *categories*.
+
+    If a *title* is given, it is appended to each category,
+    as if it were a grouping node containing the subscription list's contents.
+    """
+
+    paths = categories or [[]]
+    if title:
+        paths = [path + [title] for path in paths]
+    return [prefix + path for prefix in prefixes for path in paths if prefix + path]
+
+
+def _add(
+    objects: list[common.SuperDict],
+    found: dict[str, tuple[common.SuperDict, set[tuple[str, ...]]]],
+    url: str,
+    obj: common.SuperDict,
+    prefixes: list[list[str]],
+) -> None:
+    """Add a copy of *obj* to *objects*, or merge it into an existing object."""
+
+    if url not in found:
+        found[url] = (common.SuperDict(obj, url=url, categories=[], tags=[]), set())
+        objects.append(found[url][0])
+    target, index = found[url]
+    for category in _prefix(prefixes, obj["categories"]):
+        key = tuple(category)
+        if key not in index:
+            index.add(key)
+            target["categories"].append(category)
+            if len(category) == 1:
+                target["tags"].append(category[0])
@@ -0,0 +1,131 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+try:
+    import requests
+    import requests.adapters
+    import urllib3.util
+except ImportError:
+    requests = None  # type: ignore[assignment]
+    urllib3 = None  # type: ignore[assignment]
+
+
+class Response(t.NamedTuple):
+    """An HTTP response returned by a transport.
+
+    *headers* must support lookups using lowercase header names.
+    """
+
+    url: str
+    status: int
+    headers: t.Mapping[str, str]
+    content: bytes
+
+
+class Transport(t.Protocol):
+    """The interface that synchronous HTTP transports must implement.
+
+    Any exception raised by :py:meth:`fetch` will be stored
+    in the result's ``bozo_exception`` key.
+    """
+
+    def fetch(self, url: str, headers: dict[str, str]) -> Response:
+        """Send a GET request for *url* and return the response.
+
+        Redirects must be followed.
+        """
+
+
+class AsyncTransport(t.Protocol):
+    """The interface that asynchronous HTTP transports must implement.
+
+    Any exception raised by :py:meth:`get` will be stored
+    in the result's ``bozo_exception`` key.
+    """
+
+    async def get(self, url: str, headers: dict[str, str]) -> Response:
+        """Send a GET request for *url* and return the response.
+
+        Redirects must be followed.
+        """
+
+
+class RequestsTransport:
+    """Send HTTP requests using requests.
+
+    Connections are pooled by a ``requests.Session``
+    and are reused across requests to the same host.
+    Up to *pool_size* connections are kept open to each host.
+    Requests that fail to connect, or that receive a 429 or 5xx response,
+    are retried up to *retries* times.
+
+    If a *session* is given, it is used as-is;
+    *pool_size* and *retries* are ignored.
+
+    requests is not asynchronous,
+    so asynchronous requests are sent in worker threads.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30,
+        session: requests.Session | None = None,
+        pool_size: int = 10,
+        retries: int = 0,
+    ) -> None:
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            retry = urllib3.util.Retry(
+                total=retries,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=retry,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def fetch(self, url: str, headers: dict[str, str]) -> Response:
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        return Response(
+            url=response.url,
+            status=response.status_code,
+            headers=response.headers,
+            content=response.content,
+        )
+
+    async def get(self, url: str, headers: dict[str, str]) -> Response:
+        return await asyncio.to_thread(self.fetch, url, headers)
+
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+
+        self.session.close()
+
+
+_default: RequestsTransport | None = None
+
+
+def default() -> RequestsTransport:
+    """Return the transport used when no transport is given.
+
+    The transport is created the first time it is needed
+    so that connections are reused across calls.
+    """
+
+    global _default
+    if _default is None:
+        _default = RequestsTransport()
+    return _default
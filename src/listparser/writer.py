@@ -0,0 +1,171 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import io
+import typing as t
+import xml.sax.saxutils
+
+from . import common, dates
+
+# {version: (version attribute, type of subscription list outlines)}
+versions = {
+    "opml1": ("1.0", "link"),
+    "opml2": ("2.0", "include"),
+}
+
+# Characters that must be escaped in attribute values,
+# in addition to "&", "<", and ">".
+# Whitespace is escaped so that it isn't normalized to spaces.
+attribute_entities = {
+    '"': "&quot;",
+    "\n": "&#10;",
+    "\r": "&#13;",
+    "\t": "&#9;",
+}
+
+# {meta field: OPML element}
+head_elements = {
+    "title": "title",
+    "created": "dateCreated",
+    "modified": "dateModified",
+}
+
+# {author field: OPML element}
+owner_elements = {
+    "name": "ownerName",
+    "email": "ownerEmail",
+    "url": "ownerId",
+}
+
+
+def dump(result: t.Mapping[str, t.Any], fp: t.TextIO, version: str = "opml2") -> None:
+    """Write a parse result to *fp* as an OPML document.
+
+    *result* may be a dictionary returned by :py:func:`listparser.parse`,
+    or a result that uses slotted objects.
+    The document is written incrementally, one outline at a time.
+
+    *version* is ``"opml2"`` or ``"opml1"``.
+
+    Folders are rebuilt from each object's last category,
+    and its other categories are written in the ``category`` attribute,
+    so parsing the document returns the same objects in the same order.
+    Category names that contain ``/`` or ``,`` cannot be written
+    in the ``category`` attribute without being split.
+    Opportunities are written without their titles,
+    because OPML outlines with a title and no feed URL are folders.
+    """
+
+    if version not in versions:
+        message = f"{version!r} is not a supported version"
+        raise ValueError(message)
+    version_number, list_type = versions[version]
+
+    encoding = getattr(fp, "encoding", None)
+    if isinstance(encoding, str):
+        fp.write(f'<?xml version="1.0" encoding="{encoding}"?>\n')
+    else:
+        fp.write('<?xml version="1.0"?>\n')
+    fp.write(f'<opml version="{version_number}">\n')
+    _write_head(fp, result.get("meta"), version)
+    fp.write("<body>\n")
+
+    # *path* is the list of folder names that are currently open.
+    path: list[str] = []
+    for section in common.sections:
+        for obj in result.get(section, ()):
+            categories = _field(obj, "categories") or []
+            folder = categories[-1] if categories else []
+
+            # Close the folders that the object isn't in, and open the rest.
+            depth = 0
+            for open_name, name in zip(path, folder):
+                if open_name != name:
+                    break
+                depth += 1
+            while len(path) > depth:
+                path.pop()
+                fp.write(f"{_indent(len(path))}</outline>\n")
+            for name in folder[depth:]:
+                fp.write(f"{_indent(len(path))}<outline text={_quote(name)}>\n")
+                path.append(name)
+
+            attributes = _outline_attributes(obj, section, list_type)
+            if len(categories) > 1:
+                category = ",".join("/" + "/".join(c) for c in categories[:-1])
+                attributes.append(("category", category))
+            text = " ".join(f"{key}={_quote(value)}" for key, value in attributes)
+            fp.write(f"{_indent(len(path))}<outline {text} />\n")
+
+    while path:
+        path.pop()
+        fp.write(f"{_indent(len(path))}</outline>\n")
+    fp.write("</body>\n</opml>\n")
+
+
+def dumps(result: t.Mapping[str, t.Any], version: str = "opml2") -> str:
+    """Return a parse result as an OPML document.
+
+    *result* and *version* accept the same values as :py:func:`dump`.
+    """
+
+    fp = io.StringIO()
+    dump(result, fp, version)
+    return fp.getvalue()
+
+
+def _write_head(fp: t.TextIO, meta: t.Any, version: str) -> None:
+    fp.write("<head>\n")
+    if meta is not None:
+        for field, element in head_elements.items():
+            value = _field(meta, field)
+            if value is None:
+                parsed = _field(meta, f"{field}_parsed")
+                if parsed is not None:
+                    value = dates.format_rfc822(parsed)
+            if value is not None:
+                fp.write(f"  <{element}>{_escape(value)}</{element}>\n")
+
+        author = _field(meta, "author")
+        if author is not None:
+            for field, element in owner_elements.items():
+                value = _field(author, field)
+                # ownerId was introduced in OPML 2.0.
+                if value is not None and (field != "url" or version == "opml2"):
+                    fp.write(f"  <{element}>{_escape(value)}</{element}>\n")
+    fp.write("</head>\n")
+
+
+def _outline_attributes(
+    obj: t.Any, section: str, list_type: str
+) -> list[tuple[str, str]]:
+    url = _field(obj, "url")
+    title = _field(obj, "title") or ""
+    if section == "feeds":
+        return [("type", "rss"), ("text", title), ("xmlUrl", url)]
+    if section == "lists":
+        return [("type", list_type), ("text", title), ("url", url)]
+    return [("text", ""), ("htmlUrl", url)]
+
+
+def _field(obj: t.Any, name: str) -> t.Any:
+    """Get a field from a dictionary or from a slotted object."""
+
+    if isinstance(obj, t.Mapping):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _indent(depth: int) -> str:
+    return "  " * (depth + 1)
+
+
+def _escape(value: str) -> str:
+    return xml.sax.saxutils.escape(value)
+
+
+def _quote(value: str) -> str:
+    return f'"{xml.sax.saxutils.escape(value, attribute_entities)}"'
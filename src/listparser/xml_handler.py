@@ -7,8 +7,11 @@ from __future__ import annotations
 import collections
 import dataclasses
 import html.parser
+import time
 import typing
 
+from .exceptions import LimitExceededError
+
 prefixes = {
     "http://opml.org/spec2": "opml",
     "http://www.w3.org/1999/02/22-rdf-syntax-ns#": "rdf",
@@ -21,8 +24,18 @@ prefixes = {
 
 uris = {v: k for k, v in prefixes.items()}
 
+# {(standard_prefix, name): function}
+# A value of None means that the element is ignored.
+Dispatch = typing.Dict[
+    typing.Tuple[str, str], typing.Optional[typing.Callable[..., None]]
+]
+
+
+# Shared by all nodes whose element declares no namespaces.
+no_prefixes: frozenset[str] = frozenset()
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class Node:
     """Track information parsed from start tags.
 
@@ -33,7 +46,7 @@ class Node:
     tag: str
     standard_prefix: str
     name: str
-    namespace_prefixes: set[str]
+    namespace_prefixes: frozenset[str]
 
 
 class XMLHandler(html.parser.HTMLParser):
@@ -46,6 +59,35 @@ class XMLHandler(html.parser.HTMLParser):
     or transform the input parameters and then call the lxml API methods.
     """
 
+    # Map elements to the functions that handle them.
+    # The tables are built once for each subclass, from the names of its
+    # `start_{prefix}_{name}()` and `end_{prefix}_{name}()` methods,
+    # and are shared by all instances of the subclass.
+    start_dispatch: typing.ClassVar[Dispatch] = {}
+    end_dispatch: typing.ClassVar[Dispatch] = {}
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls.start_dispatch = {}
+        cls.end_dispatch = {}
+        for attribute in dir(cls):
+            event, _, method_name = attribute.partition("_")
+            standard_prefix, _, name = method_name.partition("_")
+            if event == "start":
+                table = cls.start_dispatch
+            elif event == "end":
+                table = cls.end_dispatch
+            else:
+                continue
+            function = getattr(cls, attribute)
+            if not name or not callable(function):
+                continue
+            table[(standard_prefix, name)] = function
+            # Elements without a namespace are handled as OPML elements.
+            if standard_prefix == "opml":
+                table[("", name)] = function
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -53,11 +95,26 @@ class XMLHandler(html.parser.HTMLParser):
         self.uris: dict[str, list[str]] = {}
         self.node_stack: collections.deque[Node] = collections.deque()
 
-        # Cache element-to-method name lookups.
-        self.start_methods: dict[
-            tuple[str, str], typing.Callable[[dict[str, str]], None] | None
+        # The class dispatch tables are used until an instance needs
+        # to disable some handlers; it then gets copies of its own.
+        self.start_methods: Dispatch = self.start_dispatch
+        self.end_methods: Dispatch = self.end_dispatch
+
+        # Cache how tags resolve in the current namespace scope.
+        # The cache is cleared whenever namespaces are declared or go out of scope.
+        #
+        # {tag: (standard_prefix, name, start_method)}
+        self.tag_cache: dict[
+            str, tuple[str, str, typing.Callable[..., None] | None]
         ] = {}
-        self.end_methods: dict[tuple[str, str], typing.Callable[[], None] | None] = {}
+
+        # Limits on the document; None means that there is no limit.
+        # *flag_limited* is set if any limit is set.
+        self.flag_limited = False
+        self.max_elements: int | None = None
+        self.max_nesting: int | None = None
+        self.deadline: float | None = None
+        self.element_count = 0
 
         # *flag_expect_text* is set by `start_*()` methods that want to capture text.
         # While set, text is captured in chunks in the *text* attribute.
@@ -65,11 +122,79 @@ class XMLHandler(html.parser.HTMLParser):
         self.flag_expect_text: bool = False
         self.text: list[str] = []
 
+    def check_limits(self) -> None:
+        """Raise an exception if the document has exceeded a limit."""
+
+        self.element_count += 1
+        if self.max_elements is not None and self.element_count > self.max_elements:
+            message = f"the document has more than {self.max_elements} elements"
+            raise LimitExceededError(message)
+        if self.max_nesting is not None and len(self.node_stack) >= self.max_nesting:
+            message = f"the document is nested more than {self.max_nesting} levels deep"
+            raise LimitExceededError(message)
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            message = "the document took too long to parse"
+            raise LimitExceededError(message)
+
     def start(self, tag: str, attrs: dict[str, str]) -> None:
         """Handle the start of an XML element."""
 
-        # Extract XML namespaces from the attributes dictionary.
-        #
+        if self.flag_limited:
+            self.check_limits()
+
+        # Most elements declare no namespaces, so *attrs* is used as-is
+        # unless an "xmlns" attribute is found.
+        namespace_prefixes = no_prefixes
+        for key in attrs:
+            if key.startswith("xmlns"):
+                attrs, namespace_prefixes = self.declare_namespaces(attrs)
+                break
+
+        try:
+            standard_prefix, name, start_method = self.tag_cache[tag]
+        except KeyError:
+            standard_prefix, name = self.resolve_tag(tag)
+            start_method = self.start_methods.get((standard_prefix, name))
+            self.tag_cache[tag] = (standard_prefix, name, start_method)
+
+        # Namespaces must be associated with the tags that introduce them
+        # so the corresponding end tag can remove them from the list.
+        self.node_stack.append(Node(tag, standard_prefix, name, namespace_prefixes))
+
+        if start_method is not None:
+            start_method(self, attrs)
+
+    def end(self, tag: str) -> None:
+        """Handle the end of an XML element."""
+
+        while True:
+            try:
+                node = self.node_stack.pop()
+            except IndexError:
+                standard_prefix, name = self.resolve_tag(tag)
+                node = Node(tag, standard_prefix, name, no_prefixes)
+
+            if node.namespace_prefixes:
+                for prefix in node.namespace_prefixes:
+                    self.uris[prefix].pop()
+                self.tag_cache.clear()
+
+            end_method = self.end_methods.get((node.standard_prefix, node.name))
+            if end_method is not None:
+                end_method(self)
+
+            if node.tag == tag:
+                break
+
+    def declare_namespaces(
+        self, attrs: dict[str, str]
+    ) -> tuple[dict[str, str], frozenset[str]]:
+        """Extract XML namespaces from the attributes dictionary.
+
+        The attributes that do not declare namespaces are returned,
+        together with the prefixes that were declared.
+        """
+
         # The HTML parser converts attribute keys to lowercase.
         #
         # ========================= ===========================
@@ -91,6 +216,14 @@ class XMLHandler(html.parser.HTMLParser):
             else:
                 attrs_excluding_xmlns[key] = value
 
+        # Cached tags may now resolve to a different standard prefix.
+        if namespace_prefixes:
+            self.tag_cache.clear()
+        return attrs_excluding_xmlns, frozenset(namespace_prefixes)
+
+    def resolve_tag(self, tag: str) -> tuple[str, str]:
+        """Return the standard prefix and the name of *tag*."""
+
         # The tag will be in the form "name" or "prefix:name".
         deployed_prefix, _, name = tag.rpartition(":")
 
@@ -108,67 +241,7 @@ class XMLHandler(html.parser.HTMLParser):
             identifier = identifier_list[-1]
         else:
             identifier = "= sentinel: no identifier ="
-        standard_prefix = prefixes.get(identifier, deployed_prefix)
-
-        # Namespaces must be associated with the tags that introduce them
-        # so the corresponding end tag can remove them from the list.
-        node = Node(
-            tag=tag,
-            standard_prefix=standard_prefix,
-            name=name,
-            namespace_prefixes=namespace_prefixes,
-        )
-        self.node_stack.append(node)
-
-        try:
-            start_method = self.start_methods[(standard_prefix, name)]
-        except KeyError:
-            if standard_prefix:
-                start_method_name = f"start_{standard_prefix}_{name}"
-                end_method_name = f"end_{standard_prefix}_{name}"
-            else:
-                start_method_name = f"start_opml_{name}"
-                end_method_name = f"end_opml_{name}"
-            start_method = getattr(self, start_method_name, None)
-            end_method = getattr(self, end_method_name, None)
-            self.start_methods[(standard_prefix, name)] = start_method
-            self.end_methods[(standard_prefix, name)] = end_method
-
-        if start_method is not None:
-            start_method(attrs_excluding_xmlns)
-
-    def end(self, tag: str) -> None:
-        """Handle the end of an XML element."""
-
-        while True:
-            try:
-                node = self.node_stack.pop()
-            except IndexError:
-                deployed_prefix, _, name = tag.rpartition(":")
-                identifier_list = self.uris.get(
-                    deployed_prefix, [uris.get(deployed_prefix, deployed_prefix)]
-                )
-                if identifier_list:
-                    identifier = identifier_list[-1]
-                else:
-                    identifier = "= sentinel: no identifier ="
-                standard_prefix = prefixes.get(identifier, deployed_prefix)
-                node = Node(
-                    tag=tag,
-                    standard_prefix=standard_prefix,
-                    name=name,
-                    namespace_prefixes=set(),
-                )
-
-            for prefix in node.namespace_prefixes:
-                self.uris[prefix].pop()
-
-            end_method = self.end_methods.get((node.standard_prefix, node.name))
-            if end_method is not None:
-                end_method()
-
-            if node.tag == tag:
-                break
+        return prefixes.get(identifier, deployed_prefix), name
 
     def data(self, data: str) -> None:
         """Handle text content of an element."""
@@ -176,12 +249,31 @@ class XMLHandler(html.parser.HTMLParser):
         if self.flag_expect_text:
             self.text.append(data)
 
+    def disable_handlers(self, keys: typing.Iterable[tuple[str, str]]) -> None:
+        """Ignore the elements identified by *keys*.
+
+        The class dispatch tables are not modified.
+        """
+
+        if self.start_methods is self.start_dispatch:
+            self.start_methods = dict(self.start_dispatch)
+            self.end_methods = dict(self.end_dispatch)
+        for key in keys:
+            self.start_methods[key] = None
+            self.end_methods[key] = None
+        self.tag_cache.clear()
+
     def close(self) -> None:
-        """Reset the handler."""
+        """Reset the handler.
+
+        The dispatch tables are kept, so the handler can be reused.
+        """
 
         super().close()
-        self.start_methods = {}
-        self.end_methods = {}
+        self.uris = {}
+        self.node_stack.clear()
+        self.tag_cache.clear()
+        self.element_count = 0
         self.flag_expect_text = False
         self.text = []
 
@@ -211,3 +303,104 @@ class XMLHandler(html.parser.HTMLParser):
     # but the method names differ.
     handle_endtag = end
     handle_data = data
+
+
+class NamespaceTarget:
+    """Translate events emitted by namespace-aware XML parsers.
+
+    lxml's XML parser reports names in the form ``{uri}name``,
+    and expat is configured to report them in the form ``uri}name``.
+    These are translated to the lowercase ``prefix:name`` form
+    that the HTML parser reports, using the standard prefix
+    if the namespace URI is known.
+
+    Namespaces are declared separately from the attributes,
+    so the elements are dispatched to *handler* directly,
+    bypassing its search for namespace declarations.
+    """
+
+    def __init__(self, handler: XMLHandler) -> None:
+        self.handler = handler
+        self.data = handler.data
+
+        # The prefixes declared in the document for each namespace URI.
+        # Elements in an unknown default namespace are handled as OPML elements,
+        # which matches how the HTML parser treats them.
+        #
+        # {uri: [prefix1, ...]}
+        self.declared: dict[str, list[str]] = {
+            "http://www.w3.org/XML/1998/namespace": ["xml"],
+        }
+        self.scope: list[str] = []
+
+        # Cache translated names while the declared namespaces do not change.
+        #
+        # {"{uri}name": ("prefix:name", standard_prefix, name)}
+        self.elements: dict[str, tuple[str, str, str]] = {}
+        # {("{uri}name", ...): ("prefix:name", ...)}
+        self.attribute_names: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+    def start(self, tag: str, attrib: typing.Mapping[str, str]) -> None:
+        handler = self.handler
+        if handler.flag_limited:
+            handler.check_limits()
+
+        element = self.elements.get(tag) or self.resolve(tag)
+        handler.node_stack.append(Node(*element, no_prefixes))
+
+        start_method = handler.start_methods.get(element[1:])
+        if start_method is None:
+            return
+
+        # Elements of the same type tend to have the same attributes,
+        # so the attribute names are translated together.
+        keys = tuple(attrib)
+        attribute_names = self.attribute_names.get(keys)
+        if attribute_names is None:
+            attribute_names = tuple(self.translate(key) for key in keys)
+            self.attribute_names[keys] = attribute_names
+        start_method(handler, dict(zip(attribute_names, attrib.values())))
+
+    def end(self, tag: str) -> None:
+        element = self.elements.get(tag) or self.resolve(tag)
+        self.handler.end(element[0])
+
+    def close(self) -> None:
+        """Do nothing.
+
+        lxml closes its target even if parsing fails,
+        so the backend closes the handler instead.
+        """
+
+    def start_ns(self, prefix: str | None, uri: str) -> None:
+        # expat reports the default namespace's prefix as None.
+        self.declared.setdefault(uri, []).append(prefix or "")
+        self.scope.append(uri)
+        self.elements.clear()
+        self.attribute_names.clear()
+
+    def end_ns(self, _: str) -> None:
+        self.declared[self.scope.pop()].pop()
+        self.elements.clear()
+        self.attribute_names.clear()
+
+    def resolve(self, tag: str) -> tuple[str, str, str]:
+        """Translate and cache *tag*, and find its standard prefix and name."""
+
+        name = self.translate(tag)
+        element = self.elements[tag] = (name, *self.handler.resolve_tag(name))
+        return element
+
+    def translate(self, name: str) -> str:
+        """Translate a name from ``{uri}name`` form to ``prefix:name`` form."""
+
+        uri, separator, name = name.rpartition("}")
+        if not separator:
+            return name.lower()
+        uri = uri.removeprefix("{")
+        prefix = prefixes.get(uri)
+        if prefix is None:
+            prefix = self.declared[uri][-1]
+        if not prefix:
+            return name.lower()
+        return f"{prefix}:{name}".lower()
@@ -0,0 +1,106 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import unittest.mock
+
+import pytest
+
+import listparser
+import listparser.cache
+from listparser.transports import Response
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+
+def document(url):
+    return f'<opml><body><outline xmlUrl="{url}feed" /></body></opml>'.encode()
+
+
+class MockTransport:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.sent_headers = []
+
+    async def get(self, url, headers):
+        self.sent_headers.append(headers)
+        if url == "http://error/":
+            raise ValueError("bogus")
+
+        self.active += 1
+        self.max_active = max(self.active, self.max_active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        response_headers = {"etag": '"abc"', "content-type": "text/xml"}
+        if headers.get("if-none-match") == '"abc"':
+            return Response(url, 304, response_headers, b"")
+        return Response(url, 200, response_headers, document(url))
+
+
+def test_aparse_url():
+    result = asyncio.run(listparser.aparse("http://a/", transport=MockTransport()))
+    assert result.status == 200
+    assert result.href == "http://a/"
+    assert result.feeds[0].url == "http://a/feed"
+
+
+def test_aparse_document():
+    result = asyncio.run(listparser.aparse(document("http://a/")))
+    assert result.feeds[0].url == "http://a/feed"
+
+
+def test_aparse_transport_error():
+    result = asyncio.run(listparser.aparse("http://error/", transport=MockTransport()))
+    assert result.bozo
+    assert isinstance(result.bozo_exception, ValueError)
+    assert result.feeds == []
+
+
+def test_aparse_cache():
+    transport = MockTransport()
+    cache = listparser.cache.MemoryCache()
+    asyncio.run(listparser.aparse("http://a/", cache=cache, transport=transport))
+    result = asyncio.run(
+        listparser.aparse("http://a/", cache=cache, transport=transport)
+    )
+    assert transport.sent_headers[-1]["if-none-match"] == '"abc"'
+    assert result.status == 304
+    assert result.feeds[0].url == "http://a/feed"
+
+
+def test_aparse_many():
+    transport = MockTransport()
+    urls = [f"http://{i}/" for i in range(10)]
+    results = asyncio.run(
+        listparser.aparse_many(urls, concurrency=3, transport=transport)
+    )
+    assert [result.feeds[0].url for result in results] == [f"{url}feed" for url in urls]
+    assert transport.max_active == 3
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_aparse_requests():
+    def get(session, url, headers, timeout):
+        mock = unittest.mock.Mock()
+        mock.url = url
+        mock.status_code = 200
+        mock.headers = {}
+        mock.content = document(url)
+        return mock
+
+    with unittest.mock.patch("requests.Session.get", get):
+        result = asyncio.run(listparser.aparse("http://a/"))
+    assert result.feeds[0].url == "http://a/feed"
+
+
+@pytest.mark.skipif(bool(requests), reason="requests must NOT be installed")
+def test_aparse_requests_not_present():
+    result = asyncio.run(listparser.aparse("http://a/"))
+    assert result.bozo
+    assert isinstance(result.bozo_exception, listparser.ListparserError)
@@ -0,0 +1,66 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+import listparser
+import listparser.batch
+
+document = """
+    <opml version="2.0" xmlns:ex="https://ns.example/">
+    <body>
+        <outline text="feed" xmlUrl="http://feed/" Description="first"
+            language="en" ex:custom="value" />
+        <outline text="feed" xmlUrl="http://feed/" description="second" />
+        <outline text="list" type="include" url="http://list/" />
+    </body>
+    </opml>
+"""
+
+
+def test_keep_all_attributes():
+    result = listparser.parse(document, keep_attributes=True)
+    attributes = result.feeds[0].attributes
+    assert attributes["description"] == "first"
+    assert attributes["language"] == "en"
+    assert attributes["ex:custom"] == "value"
+    assert attributes["xmlurl"] == "http://feed/"
+    assert result.lists[0].attributes["type"] == "include"
+
+
+@pytest.mark.parametrize(
+    "names, expected",
+    (
+        ({"description", "Language"}, {"description": "first", "language": "en"}),
+        ("description", {"description": "first"}),
+        (["missing"], {}),
+    ),
+)
+def test_keep_some_attributes(names, expected):
+    result = listparser.parse(document, keep_attributes=names)
+    assert result.feeds[0].attributes == expected
+
+
+def test_keep_no_attributes():
+    result = listparser.parse(document)
+    assert "attributes" not in result.feeds[0]
+
+
+def test_iterparse_attributes():
+    events = dict(listparser.iterparse(document, keep_attributes={"language"}))
+    assert events["feeds"].attributes == {"language": "en"}
+
+
+def test_slots_attributes():
+    result = listparser.parse(document, keep_attributes=True, result_type="slots")
+    assert result.feeds[0].attributes["description"] == "first"
+    assert result.feeds[0].to_dict()["attributes"]["language"] == "en"
+    result = listparser.parse(document, result_type="slots")
+    assert result.feeds[0].attributes is None
+    assert "attributes" not in result.feeds[0].to_dict()
+
+
+def test_pack_attributes():
+    result = listparser.parse(document, keep_attributes=True)
+    assert listparser.batch.unpack(listparser.batch.pack(result)) == result
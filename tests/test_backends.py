@@ -0,0 +1,319 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import io
+
+import pytest
+
+import listparser
+
+requires_lxml = pytest.mark.skipif(
+    listparser.lxml is None, reason="lxml must be installed"
+)
+
+foaf = """
+    <r:RDF
+        xmlns:r="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+        xmlns:f="http://xmlns.com/foaf/0.1/"
+        xmlns:s="http://www.w3.org/2000/01/rdf-schema#"
+        xmlns:x="http://purl.org/rss/1.0/"
+    >
+        <f:Agent>
+            <f:name>Feed</f:name>
+            <f:weblog><f:Document r:about="http://site/">
+                <s:seeAlso><x:channel r:about="http://feed/" /></s:seeAlso>
+            </f:Document></f:weblog>
+        </f:Agent>
+    </r:RDF>
+"""
+
+
+available_backends = [
+    name
+    for name, backend_class in listparser.backends.registry.items()
+    if backend_class.available
+]
+
+
+@pytest.mark.parametrize("backend", available_backends)
+def test_escaped_ampersands(backend):
+    document = '<opml><body><outline text="AT&amp;T" xmlUrl="http://x/?a=1&amp;b=2" />'
+    result = listparser.parse(f"{document}</body></opml>", backend=backend)
+    assert result.feeds[0].url == "http://x/?a=1&b=2"
+    assert result.feeds[0].title == "AT&T"
+
+
+def test_external_entities_are_not_loaded(tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("secret")
+    document = f"""<?xml version="1.0"?>
+        <!DOCTYPE opml [<!ENTITY e SYSTEM "{secret.as_uri()}">]>
+        <opml><body><outline text="&e;" xmlUrl="http://x/" /></body></opml>
+    """
+    result = listparser.parse(document)
+    assert "secret" not in result.feeds[0].title
+
+
+@pytest.mark.parametrize("backend", available_backends)
+def test_undeclared_namespace_prefixes(backend):
+    document = """
+        <rdf:RDF>
+            <foaf:Agent>
+                <foaf:weblog><foaf:Document rdf:about="http://site/">
+                    <rdfs:seeAlso>
+                        <rss:channel rdf:about="http://feed/" />
+                    </rdfs:seeAlso>
+                </foaf:Document></foaf:weblog>
+            </foaf:Agent>
+        </rdf:RDF>
+    """
+    result = listparser.parse(document, backend=backend)
+    assert [feed.url for feed in result.feeds] == ["http://feed/"]
+
+
+@requires_lxml
+def test_parser_warnings_do_not_fall_back_to_the_html_parser():
+    result = listparser.parse('<?xml version="1.1"?><opml><body /></opml>')
+    assert result.backend == "lxml-xml"
+
+
+@requires_lxml
+def test_undeclared_namespace_prefixes_fall_back_to_the_html_parser():
+    document = '<opml><body><x:outline xmlUrl="http://x/" /></body></opml>'
+    result = listparser.parse(document)
+    assert result.backend == "lxml-html"
+    assert result.feeds == []
+
+
+@requires_lxml
+def test_well_formed_documents_use_the_xml_parser():
+    result = listparser.parse("<opml><body /></opml>")
+    assert result.backend == "lxml-xml"
+
+
+@requires_lxml
+@pytest.mark.parametrize(
+    "document",
+    (
+        # The document is found to be malformed while it is being fed.
+        '<opml><body><outline xmlUrl="http://feed/" title="&nbsp;" /></body></opml>',
+        # The document is found to be malformed when the parser is closed.
+        '<opml><body><outline xmlUrl="http://feed/" />',
+    ),
+)
+def test_malformed_documents_fall_back_to_the_html_parser(document):
+    parser = listparser.Parser()
+    parser.handler.harvest["href"] = "http://list/"
+    parser.feed(document)
+    result = parser.close()
+    assert result.backend == "lxml-html"
+    assert result.href == "http://list/"
+    assert result.bozo is False
+    assert [feed.url for feed in result.feeds] == ["http://feed/"]
+
+
+@requires_lxml
+def test_streaming_uses_the_html_parser():
+    events = dict(listparser.iterparse("<opml><body /></opml>"))
+    assert events["document"]["backend"] == "lxml-html"
+
+
+@pytest.mark.skipif(listparser.lxml is not None, reason="lxml must not be installed")
+def test_expat_backend_is_chosen_without_lxml():
+    result = listparser.parse("<opml><body /></opml>")
+    assert result.backend == "expat"
+
+
+@requires_lxml
+def test_namespace_prefixes_are_standardized():
+    # The XML parser also standardizes the prefixes of attribute names.
+    result = listparser.parse(foaf)
+    assert result.version == "rdf"
+    assert result.feeds[0].url == "http://feed/"
+    assert result.feeds[0].title == "Feed"
+
+
+def test_unknown_default_namespace():
+    document = """
+        <opml xmlns="https://unknown.example/"><body>
+            <outline xmlUrl="http://feed/" xml:lang="en" />
+        </body></opml>
+    """
+    result = listparser.parse(document, keep_attributes=True)
+    assert result.feeds[0].url == "http://feed/"
+    assert result.feeds[0].attributes["xml:lang"] == "en"
+
+
+def test_names_are_lowercase():
+    document = (
+        '<OPML Version="2.0"><BODY><Outline XMLURL="http://feed/" /></BODY></OPML>'
+    )
+    result = listparser.parse(document)
+    assert result.version == "opml2"
+    assert result.feeds[0].url == "http://feed/"
+
+
+def test_unrecognized_backend():
+    with pytest.raises(ValueError, match="not a recognized backend"):
+        listparser.Parser(backend="bogus")
+
+
+@pytest.mark.skipif(listparser.lxml is not None, reason="lxml must not be installed")
+def test_unavailable_backend():
+    with pytest.raises(ValueError, match="not available"):
+        listparser.parse("<opml />", backend="lxml-xml")
+
+
+@pytest.mark.parametrize("backend", ("expat", "html.parser"))
+def test_backend_without_lxml(backend):
+    result = listparser.parse(foaf.encode(), backend=backend)
+    assert result.backend == backend
+    assert result.version == "rdf"
+
+
+@pytest.mark.parametrize(
+    "document",
+    (
+        # The document is found to be malformed while it is being fed.
+        '<opml><body><outline xmlUrl="http://a/" /><x:outline /></body></opml>',
+        # The document is found to be malformed when the parser is closed.
+        '<opml><body><outline xmlUrl="http://a/" /></body>',
+    ),
+)
+def test_streaming_stops_at_syntax_errors(document):
+    events = list(listparser.iterparse(document, backend="expat"))
+    assert [obj["url"] for key, obj in events if key == "feeds"] == ["http://a/"]
+    info = events[-1][1]
+    assert info["backend"] == "expat"
+    assert info["bozo"] is True
+    assert isinstance(
+        info["bozo_exception"], listparser.backends.xml.parsers.expat.ExpatError
+    )
+
+
+@pytest.mark.parametrize(
+    "document, title",
+    (
+        (b"<opml><head><title>\xe9</title></head></opml>", "\ufffd"),
+        # The document ends in the middle of a character.
+        (b"<opml><head><title>x</title></head></opml>\xc3", "x"),
+    ),
+)
+def test_expat_recovers_from_decoding_errors(document, title):
+    result = listparser.parse(document, backend="expat")
+    assert result.backend == "html.parser"
+    assert result.meta.title == title
+
+
+@pytest.mark.parametrize("encoding", ("utf-16", "utf-32", "hex", "rot13", "bogus"))
+def test_html_parser_decodes_wrong_encodings_as_utf8(encoding):
+    document = "<opml><head><title>\u00e9</title></head></opml>".encode()
+    parser = listparser.Parser(backend="html.parser")
+    backend = listparser.backends.HTMLParserBackend(parser.handler, encoding)
+    backend.feed(document)
+    backend.close()
+    assert parser.handler.harvest["meta"]["title"] == "\u00e9"
+
+
+# The document doesn't begin with "<", so the charset is used to decode it.
+wrong_charset = (
+    "\u00a0<opml><head><title>\u00e9</title></head>"
+    '<body><outline xmlUrl="http://a/" /></body></opml>'
+).encode()
+
+
+@pytest.mark.parametrize("charset", ("utf-16", "utf-32"))
+@pytest.mark.parametrize("backend", ("expat", "html.parser"))
+def test_parse_with_wrong_charset(charset, backend):
+    parser = listparser.Parser(encoding=charset, backend=backend)
+    parser.feed(wrong_charset)
+    result = parser.close()
+    assert result.backend == "html.parser"
+    assert result.meta.title == "\u00e9"
+    assert result.feeds[0].url == "http://a/"
+
+
+@pytest.mark.parametrize("charset", ("utf-16", "utf-32"))
+def test_iterparse_with_wrong_charset(charset):
+    class Transport:
+        def fetch(self, url, headers):
+            headers = {"content-type": f"text/xml; charset={charset}"}
+            return listparser.transports.Response(url, 200, headers, wrong_charset)
+
+    transport = Transport()
+    events = dict(
+        listparser.iterparse("http://a/", transport=transport, backend="html.parser")
+    )
+    assert events["feeds"].url == "http://a/"
+    assert events["document"]["bozo"] is False
+
+
+def test_limits_while_recovering():
+    document = '<opml><body><outline xmlUrl="http://a/" /><outline /><x:outline />'
+    result = listparser.parse(document, backend="expat", max_elements=4)
+    assert result.backend == "html.parser"
+    assert isinstance(result.bozo_exception, listparser.LimitExceededError)
+
+
+class Unseekable(io.RawIOBase):
+    def __init__(self, document):
+        self.file = io.BytesIO(document)
+
+    def readinto(self, buffer):
+        return self.file.readinto(buffer)
+
+
+malformed = (
+    '<opml><body><outline xmlUrl="http://1/" title="&nbsp;" />'
+    + '<outline xmlUrl="http://2/" />' * 20
+).encode()
+
+
+@pytest.mark.parametrize(
+    "make_source",
+    (
+        lambda path: path,
+        lambda path: path.open("rb"),
+        lambda path: path.read_bytes(),
+        lambda path: path.read_text(),
+        lambda path: memoryview(path.read_bytes()),
+        lambda path: Unseekable(path.read_bytes()),
+    ),
+)
+def test_recovery_rereads_the_document(tmp_path, monkeypatch, make_source):
+    monkeypatch.setattr(listparser, "CHUNK_SIZE", 64)
+    path = tmp_path / "list.opml"
+    path.write_bytes(malformed)
+    source = make_source(path)
+    result = listparser.parse(source, backend="expat")
+    if hasattr(source, "close"):
+        source.close()
+    assert result.backend == "html.parser"
+    assert [feed.url for feed in result.feeds] == ["http://1/", "http://2/"]
+
+
+def test_rereadable_files_are_not_kept(tmp_path, monkeypatch):
+    monkeypatch.setattr(listparser, "CHUNK_SIZE", 64)
+    path = tmp_path / "list.opml"
+    path.write_bytes(b"<!-- comment -->" + malformed)
+    with path.open("rb") as file:
+        file.read(16)
+        parser = listparser.Parser(backend="expat")
+        parser.feed_file(file)
+        assert parser.chunks is None
+        result = parser.close()
+    assert result.backend == "html.parser"
+    assert len(result.feeds) == 2
+
+
+def test_unseekable_files_are_kept():
+    parser = listparser.Parser(backend="expat")
+    parser.feed(b"<opml>")
+    parser.feed_file(Unseekable(b"<body></body></opml>"))
+    assert parser.chunks == [b"<opml>", b"<body></body></opml>"]
+    assert parser.close().bozo is False
+
+
+def test_reread_a_shorter_document():
+    assert list(listparser._reread(b"abc", 10)) == [b"abc"]
@@ -0,0 +1,90 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import pickle
+import unittest.mock
+
+import pytest
+
+import listparser
+import listparser.batch
+import listparser.common
+
+
+def document(index):
+    return f"""
+        <opml version="2.0">
+        <head><title>list {index}</title></head>
+        <body>
+            <outline text="folder">
+                <outline text="{index}" xmlUrl="https://domain.example/{index}" />
+            </outline>
+            <outline text="list" type="link" url="https://domain.example/a.opml" />
+        </body>
+        </opml>
+    """
+
+
+def test_pack_round_trip():
+    result = listparser.parse(document(1))
+    packed = listparser.batch.pack(result)
+    assert isinstance(packed["feeds"][0], tuple)
+    assert type(packed["meta"]) is dict
+    unpacked = listparser.batch.unpack(pickle.loads(pickle.dumps(packed)))
+    assert unpacked == result
+    assert unpacked.feeds[0].categories == [["folder"]]
+    assert unpacked.meta.title == "list 1"
+
+
+def test_pack_irregular_object():
+    result = listparser.common.SuperDict(
+        feeds=[listparser.common.SuperDict(url="https://domain.example/", extra=1)],
+    )
+    packed = listparser.batch.pack(result)
+    assert packed["feeds"] == [{"url": "https://domain.example/", "extra": 1}]
+    assert listparser.batch.unpack(packed).feeds[0].extra == 1
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_parse_many_ordered(executor):
+    sources = (document(index) for index in range(40))
+    results = list(
+        listparser.parse_many(sources, workers=2, executor=executor, chunksize=3)
+    )
+    assert [result.meta.title for result in results] == [
+        f"list {index}" for index in range(40)
+    ]
+    assert all(not result.bozo for result in results)
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_parse_many_unordered(executor):
+    sources = [document(index) for index in range(10)]
+    results = listparser.parse_many(
+        sources, workers=2, executor=executor, ordered=False, chunksize=4
+    )
+    for index, result in results:
+        assert result.meta.title == f"list {index}"
+
+
+def test_parse_many_empty():
+    assert list(listparser.parse_many([], executor="thread")) == []
+
+
+def test_parse_many_worker_error():
+    error = RuntimeError("worker died")
+    with unittest.mock.patch("listparser._parse_chunk", side_effect=error):
+        results = list(
+            listparser.parse_many(["a", "b", "c"], executor="thread", chunksize=2)
+        )
+    assert len(results) == 3
+    for result in results:
+        assert result.bozo
+        assert result.bozo_exception is error
+        assert result.feeds == []
+
+
+def test_parse_chunk_packed():
+    (packed,) = listparser._parse_chunk([document(1)], True)
+    assert packed == listparser.batch.pack(listparser.parse(document(1)))
@@ -0,0 +1,38 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import listparser.cache
+from listparser.common import SuperDict
+
+
+def test_memory_cache_eviction():
+    cache = listparser.cache.MemoryCache(maxsize=2)
+    cache.set("a", SuperDict(url="a"))
+    cache.set("b", SuperDict(url="b"))
+    assert cache.get("a") == {"url": "a"}
+
+    # "b" is now the least-recently used result.
+    cache.set("c", SuperDict(url="c"))
+    assert cache.get("b") is None
+    assert cache.get("a") == {"url": "a"}
+    assert cache.get("c") == {"url": "c"}
+
+
+def test_file_cache(tmp_path):
+    cache = listparser.cache.FileCache(tmp_path / "cache")
+    assert cache.get("a") is None
+
+    cache.set("a", SuperDict(url="a", feeds=[SuperDict(url="b")]))
+    result = cache.get("a")
+    assert isinstance(result, SuperDict)
+    assert result.feeds[0].url == "b"
+    assert [path.suffix for path in (tmp_path / "cache").iterdir()] == [".pickle"]
+
+
+def test_file_cache_corrupt_file(tmp_path):
+    cache = listparser.cache.FileCache(tmp_path)
+    cache.set("a", SuperDict(url="a"))
+    for path in tmp_path.iterdir():
+        path.write_bytes(b"")
+    assert cache.get("a") is None
@@ -0,0 +1,141 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import codecs
+
+import pytest
+
+import listparser
+import listparser.charsets
+
+
+@pytest.mark.parametrize(
+    "prefix, expected",
+    (
+        pytest.param(codecs.BOM_UTF8 + b"<opml", "utf-8", id="utf-8 bom"),
+        pytest.param(codecs.BOM_UTF16_LE + b"<\x00", "utf-16", id="utf-16 bom"),
+        pytest.param(codecs.BOM_UTF32_BE + b"\x00\x00\x00<", "utf-32", id="utf-32 bom"),
+        pytest.param(b"<\x00?\x00x\x00", "utf-16le", id="utf-16le"),
+        pytest.param(b"\x00<\x00?\x00x", "utf-16be", id="utf-16be"),
+        pytest.param(
+            b'<?xml version="1.0" encoding="ISO-8859-1"?>',
+            "iso-8859-1",
+            id="declaration",
+        ),
+        pytest.param(
+            b"  <?xml version='1.0' encoding='windows-1252' ?>",
+            "windows-1252",
+            id="declaration with whitespace",
+        ),
+        pytest.param(
+            b'<?xml version="1.0" encoding="bogus"?>',
+            "utf-8",
+            id="unknown encoding",
+        ),
+        pytest.param(
+            b'<?xml version="1.0" encoding="utf-16"?>',
+            "utf-8",
+            id="encoding that is not ASCII-compatible",
+        ),
+        pytest.param(
+            b'<?xml version="1.0" encoding="hex"?>',
+            "utf-8",
+            id="codec that is not a text encoding",
+        ),
+        pytest.param(b'<?xml version="1.0"?>', "utf-8", id="no encoding"),
+        pytest.param(b"<opml>", "utf-8", id="no declaration"),
+    ),
+)
+def test_sniff(prefix, expected):
+    assert listparser.charsets.sniff(prefix) == expected
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    (
+        ("application/xml; charset=ISO-8859-1", "iso-8859-1"),
+        ('text/xml; charset="utf-8"', "utf-8"),
+        ("text/xml; charset=bogus", None),
+        ("text/xml; charset=UTF-16LE", "utf-16le"),
+        ("text/xml; charset=rot13", None),
+        ("text/xml; charset=undefined", None),
+        ("text/xml", None),
+        ("", None),
+    ),
+)
+def test_from_content_type(content_type, expected):
+    assert listparser.charsets.from_content_type(content_type) == expected
+
+
+title = "éü"
+doc = f"<opml><head><title>{title}</title></head></opml>"
+
+
+def declare(encoding):
+    return f'<?xml version="1.0" encoding="{encoding}"?>{doc}'
+
+
+@pytest.mark.parametrize(
+    "content, encoding",
+    (
+        pytest.param(
+            declare("iso-8859-1").encode("iso-8859-1"), None, id="declaration"
+        ),
+        pytest.param(doc.encode("utf-16"), None, id="bom"),
+        pytest.param(doc.encode("utf8"), None, id="default"),
+        pytest.param(
+            declare("utf_8").encode("utf8"), None, id="python-only encoding name"
+        ),
+        pytest.param(
+            declare("utf-8").encode("cp1252"),
+            "cp1252",
+            id="charset overrides declaration",
+        ),
+        pytest.param(doc.encode("utf-16"), "iso-8859-1", id="bom overrides charset"),
+        pytest.param(doc.encode("utf8"), "bogus", id="unknown charset"),
+        pytest.param(doc.encode("utf-16le"), "utf-16le", id="charset without a bom"),
+    ),
+)
+@pytest.mark.parametrize("chunk_size", (1, 4096))
+def test_parser_encoding(content, encoding, chunk_size):
+    parser = listparser.Parser(encoding=encoding)
+    for offset in range(0, len(content), chunk_size):
+        parser.feed(content[offset : offset + chunk_size])
+    result = parser.close()
+    assert result.meta.title == title
+
+
+# Encodings that UTF-8 documents are commonly mislabeled with,
+# and codecs that are not text encodings.
+impossible_encodings = (
+    "utf-16",
+    "utf-32",
+    "UTF-16LE",
+    "hex",
+    "rot13",
+    "zlib",
+    "base64",
+    "uu",
+    "undefined",
+)
+
+
+@pytest.mark.parametrize("encoding", impossible_encodings)
+@pytest.mark.parametrize("backend", ("auto", "expat", "html.parser"))
+def test_impossible_declared_encoding(encoding, backend):
+    content = declare(encoding).encode("utf8")
+    result = listparser.parse(content, backend=backend)
+    assert not result.bozo
+    assert result.meta.title == title
+
+
+@pytest.mark.parametrize("encoding", impossible_encodings)
+@pytest.mark.parametrize("backend", ("auto", "expat", "html.parser"))
+def test_impossible_charset(encoding, backend):
+    content = declare("utf-8").encode("utf8")
+    parser = listparser.Parser(encoding=encoding, backend=backend)
+    parser.feed(content)
+    result = parser.close()
+    assert not result.bozo
+    assert result.meta.title == title
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 import datetime
+import math
 
 import pytest
 
@@ -227,6 +228,37 @@ def test_rfc3339_dates(date: str, expected: datetime.datetime):
     assert listparser.dates.parse_rfc3339(date) == expected
 
 
+@pytest.mark.parametrize(
+    "date, expected",
+    (
+        (
+            "Mon, 07 Apr 2025 19:52:30 GMT",
+            datetime.datetime(2025, 4, 7, 19, 52, 30, tzinfo=datetime.timezone.utc),
+        ),
+        (
+            "2025-04-07T19:52:30Z",
+            datetime.datetime(2025, 4, 7, 19, 52, 30, tzinfo=datetime.timezone.utc),
+        ),
+        ("2025-04-07", None),
+        ("2025", None),
+        ("", None),
+    ),
+)
+def test_parse_date(date, expected):
+    assert listparser.dates.parse_date(date) == expected
+
+
+def test_parse_date_is_cached():
+    date = "2025-04-07T19:52:30.1234+01:00"
+    assert listparser.dates.parse_date(date) is listparser.dates.parse_date(date)
+
+
+def test_timezones_are_shared():
+    first = listparser.dates.parse_rfc822("07 Apr 2025 19:52:30 -0130")
+    second = listparser.dates.parse_rfc822("08 Apr 2025 19:52:30 -01:30")
+    assert first.tzinfo is second.tzinfo
+
+
 @pytest.mark.parametrize(
     "date",
     (
@@ -238,8 +270,106 @@ def test_rfc3339_dates(date: str, expected: datetime.datetime):
         pytest.param("2025-01-01T01:01:99Z", id="invalid seconds"),
         pytest.param("2025-01-01T01:01:01+99:00", id="invalid timezone offset hours"),
         pytest.param("2025-01-01TT01:01:01Z", id="invalid separator"),
+        pytest.param("2025-01-99T01:01:01.5+01:00", id="invalid day with fraction"),
+        pytest.param("2025-01-99T01:01:01", id="invalid day without timezone"),
         pytest.param("tomorrow-ish", id="invalid format"),
     ),
 )
 def test_rfc3339_invalid_dates(date: str):
     assert listparser.dates.parse_rfc3339(date) is None
+
+
+@pytest.mark.parametrize(
+    "date",
+    (
+        pytest.param(datetime.datetime(2026, 10, 17, 12, 0, 0), id="naive"),
+        pytest.param(
+            datetime.datetime(
+                2026,
+                10,
+                17,
+                14,
+                0,
+                0,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=2)),
+            ),
+            id="offset",
+        ),
+    ),
+)
+def test_format_rfc822(date):
+    formatted = listparser.dates.format_rfc822(date)
+    assert formatted == "Sat, 17 Oct 2026 12:00:00 GMT"
+    assert listparser.dates.parse_rfc822(formatted) == datetime.datetime(
+        2026, 10, 17, 12, tzinfo=datetime.timezone.utc
+    )
+
+
+def test_parse_many():
+    dates = [
+        "Mon, 07 Apr 2025 19:52:30 GMT",
+        "2025-04-07T19:52:30+02:00",
+        "2025-01-99T01:01:01Z",
+        "2025-04-07",
+        "2025-04-07T19:52:30.941378073Z",
+        "bogus",
+        "Mon, 07 Apr 2025 19:52:30 GMT",
+    ]
+    expected = [listparser.dates.parse_date(date) for date in dates]
+    assert listparser.dates.parse_many(iter(dates)) == expected
+
+
+def test_parse_many_epoch():
+    dates = [
+        "Thu, 01 Jan 1970 01:00:00 +0100",
+        "1970-01-02T00:00:00",
+        "bogus",
+    ]
+    seconds = listparser.dates.parse_many_epoch(dates)
+    assert seconds.typecode == "d"
+    assert seconds[:2].tolist() == [0.0, 86400.0]
+    assert math.isnan(seconds[2])
+
+
+lazy_document = """
+    <opml><head>
+        <dateCreated>Sat, 07 Sep 2002 00:00:01 GMT</dateCreated>
+        <dateModified>bogus</dateModified>
+    </head></opml>
+"""
+
+
+def test_lazy_dates():
+    result = listparser.parse(lazy_document, lazy_dates=True)
+    assert result.bozo is False
+    assert "created_parsed" not in dict.keys(result.meta)
+    expected = datetime.datetime(2002, 9, 7, 0, 0, 1, tzinfo=datetime.timezone.utc)
+    assert result.meta["created_parsed"] == expected
+    assert result.meta.created_parsed is result.meta["created_parsed"]
+    assert dict.__getitem__(result.meta, "created_parsed") == expected
+    # Invalid dates are missing, just as they are when parsed eagerly.
+    assert "modified_parsed" not in result.meta
+    assert result.meta.get("modified_parsed") is None
+    with pytest.raises(KeyError):
+        result.meta["modified_parsed"]
+    with pytest.raises(KeyError):
+        result.meta["bogus"]
+    assert 1 not in result.meta
+
+
+def test_lazy_dates_strict_mode():
+    result = listparser.parse(lazy_document)
+    assert result.bozo is True
+    assert "created_parsed" in dict.keys(result.meta)
+
+
+def test_lazy_dates_as_slots():
+    result = listparser.parse(lazy_document, lazy_dates=True, result_type="slots")
+    assert result.meta.created_parsed.year == 2002
+    assert result.meta.modified_parsed is None
+
+
+def test_lazy_dates_while_streaming():
+    events = dict(listparser.iterparse(lazy_document, lazy_dates=True))
+    assert events["meta"].created_parsed.year == 2002
+    assert events["document"].bozo is False
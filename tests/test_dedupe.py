@@ -0,0 +1,132 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import pickle
+
+import pytest
+
+import listparser
+import listparser.cache
+import listparser.dedupe
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    (
+        ("HTTP://Example.COM", "http://example.com/"),
+        ("https://example.com:443/feed/", "https://example.com/feed"),
+        ("http://example.com:8080/feed", "http://example.com:8080/feed"),
+        ("http://example.com:/feed", "http://example.com/feed"),
+        ("http://User@Example.com:80/", "http://User@example.com/"),
+        ("http://example.com/feed?a=1#top", "http://example.com/feed?a=1"),
+        ("  http://example.com/  ", "http://example.com/"),
+        ("http://[::1]:80/", "http://[::1]/"),
+        ("feed://example.com/rss", "http://example.com/rss"),
+        ("FEED:https://example.com/rss", "https://example.com/rss"),
+        ("feed://http://example.com/rss", "http://example.com/rss"),
+        # URLs that are not HTTP URLs, or that cannot be parsed, are unchanged.
+        ("mailto:Someone@Example.com", "mailto:Someone@Example.com"),
+        ("http://example.com:port/", "http://example.com:port/"),
+    ),
+)
+def test_canonicalize(url, expected):
+    assert listparser.dedupe.canonicalize(url) == expected
+
+
+def test_feed_index():
+    index = listparser.FeedIndex()
+    assert index.add("http://example.com/feed/") is True
+    assert index.add("HTTP://EXAMPLE.com:80/feed") is False
+    assert "feed://example.com/feed" in index
+    assert "http://example.com/other" not in index
+    assert 1 not in index
+    assert len(index) == 1
+
+
+def test_feed_index_without_canonicalization():
+    index = listparser.FeedIndex(canonicalize=None)
+    index.add("http://example.com/feed")
+    assert "http://example.com/feed" in index
+    assert "http://example.com/feed/" not in index
+
+
+def test_feed_index_grows():
+    index = listparser.FeedIndex()
+    urls = [f"http://example.com/{i}" for i in range(1000)]
+    assert all(index.add(url) for url in urls)
+    assert not any(index.add(url) for url in urls)
+    assert len(index) == 1000
+    assert len(index.table) == 2048
+    copy = pickle.loads(pickle.dumps(index))
+    assert all(url in copy for url in urls)
+
+
+def document(*urls):
+    outlines = "".join(f'<outline xmlUrl="{url}" />' for url in urls)
+    return f"<opml><body>{outlines}</body></opml>"
+
+
+@pytest.mark.parametrize("result_type", ("dict", "slots"))
+def test_parse_reports_duplicates(result_type):
+    index = listparser.FeedIndex()
+    first = listparser.parse(
+        document("http://a/", "http://A/"), index=index, result_type=result_type
+    )
+    assert first.deduplication.new.feeds == [first.feeds[0]]
+    assert first.deduplication.duplicates.feeds == [first.feeds[1]]
+    second = listparser.parse(
+        document("feed://a", "http://b/"), index=index, result_type=result_type
+    )
+    assert second.deduplication.new.feeds == [second.feeds[1]]
+    assert second.deduplication.duplicates.feeds == [second.feeds[0]]
+    assert second.deduplication.new.lists == []
+    assert len(index) == 2
+
+
+def test_parse_without_index():
+    result = listparser.parse(document("http://a/"))
+    assert "deduplication" not in result
+
+
+def test_parse_many_reports_duplicates():
+    index = listparser.FeedIndex()
+    documents = [document("http://a/"), document("http://a/", "http://b/")]
+    results = list(listparser.parse_many(documents, executor="thread", index=index))
+    new = [[feed.url for feed in r.deduplication.new.feeds] for r in results]
+    assert new == [["http://a/"], ["http://b/"]]
+    assert len(index) == 2
+
+
+def test_parse_many_unordered_reports_duplicates():
+    index = listparser.FeedIndex()
+    documents = [document("http://a/"), document("http://a/", "http://b/")]
+    results = listparser.parse_many(
+        documents, executor="thread", ordered=False, index=index
+    )
+    reports = [result.deduplication for _, result in results]
+    assert sum(len(report.new.feeds) for report in reports) == 2
+    assert sum(len(report.duplicates.feeds) for report in reports) == 1
+
+
+class ConditionalTransport:
+    def fetch(self, url, headers):
+        if headers.get("if-none-match") == '"abc"':
+            return listparser.transports.Response(url, 304, {"etag": '"abc"'}, b"")
+        content = document("http://a/").encode("utf8")
+        return listparser.transports.Response(url, 200, {"etag": '"abc"'}, content)
+
+
+def test_cached_results_are_not_modified():
+    cache = listparser.cache.MemoryCache()
+    transport = ConditionalTransport()
+    index = listparser.FeedIndex()
+    result = listparser.parse(
+        "http://list/", cache=cache, transport=transport, index=index
+    )
+    assert len(result.deduplication.new.feeds) == 1
+    assert "deduplication" not in cache.get("http://list/")
+
+    result = listparser.parse("http://list/", cache=cache, transport=transport)
+    assert result.status == 304
+    assert "deduplication" not in result
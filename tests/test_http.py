@@ -2,11 +2,15 @@
 # Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
 # SPDX-License-Identifier: MIT
 
+import datetime
 import unittest.mock
 
 import pytest
 
 import listparser
+import listparser.cache
+import listparser.transports
+from listparser.transports import Response
 
 try:
     import requests
@@ -15,20 +19,45 @@ except ImportError:
 
 
 empty_doc = '<?xml version="1.0"?><opml />'
+latin1_doc = "<opml><head><title>\u00e9</title></head></opml>"
+feed_doc = '<opml><body><outline xmlUrl="http://a/" /></body></opml>'
+
+
+etag = '"abc"'
+last_modified = "Sat, 17 Oct 2026 12:00:00 GMT"
 
 
 @pytest.fixture
 def http():
-    def get(url, *args, **kwargs):
+    sent_headers = []
+
+    def get(session, url, headers, timeout):
+        sent_headers.append(headers)
         if url == "http://":
             raise requests.exceptions.InvalidURL("no host supplied")
+        mock = unittest.mock.Mock()
+        mock.url = url
+        mock.status_code = 200
+        if url == "http://latin1":
+            mock.content = latin1_doc.encode("iso-8859-1")
+            mock.headers = {"content-type": "text/xml; charset=ISO-8859-1"}
+        elif url == "http://conditional":
+            mock.headers = {"etag": etag, "last-modified": last_modified}
+            if (
+                headers.get("if-none-match") == etag
+                or headers.get("if-modified-since") == last_modified
+            ):
+                mock.status_code = 304
+                mock.content = b""
+            else:
+                mock.content = feed_doc.encode("utf8")
         else:
-            mock = unittest.mock.Mock()
-            mock.text = empty_doc
-            return mock
+            mock.content = empty_doc.encode("utf8")
+            mock.headers = {"content-type": "text/xml"}
+        return mock
 
-    with unittest.mock.patch("listparser.requests.get", get):
-        yield
+    with unittest.mock.patch("requests.Session.get", get):
+        yield sent_headers
 
 
 @pytest.mark.skipif(requests is None, reason="requests must be installed")
@@ -38,6 +67,15 @@ def test_requests_success(http):
     assert not info["bozo"]
 
 
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_requests_charset(http):
+    content, info = listparser.get_content("http://latin1")
+    assert isinstance(content, bytes)
+    assert info["encoding"] == "iso-8859-1"
+    result = listparser.parse("http://latin1")
+    assert result.meta.title == "\u00e9"
+
+
 @pytest.mark.skipif(requests is None, reason="requests must be installed")
 def test_requests_error(http):
     content, info = listparser.get_content("http://")
@@ -45,6 +83,175 @@ def test_requests_error(http):
     assert info["bozo"]
 
 
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_response_info(http):
+    result = listparser.parse("http://conditional")
+    assert result.href == "http://conditional"
+    assert result.status == 200
+    assert result.etag == etag
+    assert result.modified == last_modified
+    assert len(result.feeds) == 1
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"etag": etag},
+        {"modified": last_modified},
+        {"modified": datetime.datetime(2026, 10, 17, 12, tzinfo=datetime.timezone.utc)},
+    ),
+)
+def test_not_modified(http, kwargs):
+    result = listparser.parse("http://conditional", **kwargs)
+    assert result.status == 304
+    assert not result.bozo
+    assert result.feeds == []
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+@pytest.mark.parametrize("cache_type", ("memory", "file"))
+def test_cache(http, cache_type, tmp_path):
+    if cache_type == "memory":
+        cache = listparser.cache.MemoryCache()
+    else:
+        cache = listparser.cache.FileCache(tmp_path / "cache")
+
+    result = listparser.parse("http://conditional", cache=cache)
+    assert result.status == 200
+    assert "if-none-match" not in http[-1]
+
+    result = listparser.parse("http://conditional", cache=cache)
+    assert http[-1]["if-none-match"] == etag
+    assert http[-1]["if-modified-since"] == last_modified
+    assert result.status == 304
+    assert result.feeds[0].url == "http://a/"
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_cache_skips_bozo_results(http):
+    cache = listparser.cache.MemoryCache()
+    result = listparser.parse("http://conditional", cache=cache, max_bytes=20)
+    assert result.bozo is True
+    assert cache.get("http://conditional") is None
+
+    result = listparser.parse("http://conditional", cache=cache)
+    assert "if-none-match" not in http[-1]
+    assert result.status == 200
+    assert result.bozo is False
+    assert result.feeds[0].url == "http://a/"
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+@pytest.mark.parametrize(
+    "options",
+    (
+        {"only": ["feeds.url"]},
+        {"keep_attributes": True},
+        {"tree": True},
+        {"lazy_dates": True},
+    ),
+)
+def test_cache_requires_default_options(http, options):
+    cache = listparser.cache.MemoryCache()
+    listparser.parse("http://conditional", cache=cache, **options)
+    assert cache.get("http://conditional") is None
+
+    listparser.parse("http://conditional", cache=cache)
+    result = listparser.parse("http://conditional", cache=cache, **options)
+    assert "if-none-match" not in http[-1]
+    assert result.status == 200
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_cache_requires_validators(http):
+    cache = listparser.cache.MemoryCache()
+    listparser.parse("http://example", cache=cache)
+    assert cache.get("http://example") is None
+
+
+class MockTransport:
+    def __init__(self, error=None):
+        self.error = error
+        self.urls = []
+
+    def fetch(self, url, headers):
+        self.urls.append(url)
+        if self.error:
+            raise self.error
+        return Response(url, 200, {}, feed_doc.encode("utf8"))
+
+
+def test_transport():
+    transport = MockTransport()
+    result = listparser.parse("http://a/", transport=transport)
+    assert transport.urls == ["http://a/"]
+    assert result.feeds[0].url == "http://a/"
+
+
+def test_transport_invalid_bytes():
+    content = "<opml><head><title>\u00e9</title></head></opml>".encode("latin-1")
+    transport = MockTransport()
+    transport.fetch = lambda url, headers: Response(
+        url, 200, {"content-type": "text/xml; charset=utf-8"}, content
+    )
+    result = listparser.parse("http://a/", transport=transport, backend="html.parser")
+    assert result.meta.title == "\ufffd"
+
+
+@pytest.mark.parametrize("charset", ("utf-16", "UTF-32", "hex", "rot13"))
+def test_transport_impossible_charset(charset):
+    content = feed_doc.encode("utf8")
+    transport = MockTransport()
+    transport.fetch = lambda url, headers: Response(
+        url, 200, {"content-type": f"text/xml; charset={charset}"}, content
+    )
+    result = listparser.parse("http://a/", transport=transport)
+    assert not result.bozo
+    assert result.feeds[0].url == "http://a/"
+
+
+def test_transport_error():
+    error = OSError("connection refused")
+    result = listparser.parse("http://a/", transport=MockTransport(error))
+    assert result.bozo
+    assert result.bozo_exception is error
+
+
+def test_parse_many_transport():
+    transport = MockTransport()
+    urls = [f"http://{index}/" for index in range(5)]
+    results = list(listparser.parse_many(urls, executor="thread", transport=transport))
+    assert sorted(transport.urls) == urls
+    assert all(result.feeds[0].url == "http://a/" for result in results)
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_default_transport_is_shared(http):
+    listparser.parse("http://example")
+    transport = listparser.transports.default()
+    assert isinstance(transport, listparser.transports.RequestsTransport)
+    assert listparser.transports.default() is transport
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_requests_transport_pool():
+    transport = listparser.transports.RequestsTransport(pool_size=20, retries=3)
+    adapter = transport.session.get_adapter("https://domain.example/")
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 3
+    transport.close()
+
+
+@pytest.mark.skipif(requests is None, reason="requests must be installed")
+def test_requests_transport_session(http):
+    session = requests.Session()
+    transport = listparser.transports.RequestsTransport(session=session)
+    assert transport.session is session
+    result = listparser.parse("http://latin1", transport=transport)
+    assert result.meta.title == "\u00e9"
+
+
 @pytest.mark.skipif(bool(requests), reason="requests must NOT be installed")
 def test_requests_not_present():
     content, info = listparser.get_content("http://example")
@@ -0,0 +1,115 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import itertools
+import time
+
+import pytest
+
+import listparser
+import listparser.transports
+
+outlines = "".join(f'<outline xmlUrl="http://{i}/" />' for i in range(100))
+document = f"<opml><body>{outlines}</body></opml>"
+nested = '<opml><body>{}<outline xmlUrl="http://deep/" />{}</body></opml>'.format(
+    '<outline text="folder">' * 100, "</outline>" * 100
+)
+
+
+def assert_partial(result, message):
+    assert result.bozo
+    assert isinstance(result.bozo_exception, listparser.LimitExceededError)
+    assert isinstance(result.bozo_exception, listparser.ListparserError)
+    assert message in str(result.bozo_exception)
+
+
+def test_max_elements():
+    result = listparser.parse(document, max_elements=50)
+    assert_partial(result, "more than 50 elements")
+    assert 40 < len(result.feeds) < 50
+
+
+def test_max_nesting():
+    result = listparser.parse(nested, max_nesting=20)
+    assert_partial(result, "more than 20 levels")
+    assert result.feeds == []
+
+
+@pytest.mark.parametrize("source", (document, document.encode("utf8")))
+def test_max_bytes(source, monkeypatch):
+    monkeypatch.setattr(listparser, "CHUNK_SIZE", 100)
+    result = listparser.parse(source, max_bytes=1000)
+    assert_partial(result, "larger than 1000 bytes")
+    assert 0 < len(result.feeds) < 100
+
+
+def test_max_time(monkeypatch):
+    # Each call to the clock advances it by one second.
+    monkeypatch.setattr(time, "monotonic", itertools.count().__next__)
+    result = listparser.parse(document, max_time=30)
+    assert_partial(result, "too long")
+    assert 0 < len(result.feeds) < 30
+
+
+def test_max_time_between_chunks():
+    parser = listparser.Parser(max_time=-1)
+    parser.feed(document)
+    result = parser.close()
+    assert_partial(result, "too long")
+    assert result.feeds == []
+
+
+def test_no_limits():
+    result = listparser.parse(nested)
+    assert not result.bozo
+    assert result.feeds[0].categories == [["folder"] * 100]
+
+
+def test_limits_not_exceeded():
+    result = listparser.parse(
+        nested, max_elements=1000, max_nesting=1000, max_bytes=10**6, max_time=60
+    )
+    assert not result.bozo
+    assert len(result.feeds) == 1
+
+
+def test_iterparse_limit():
+    events = list(listparser.iterparse(document, max_elements=10))
+    key, result = events[-1]
+    assert key == "document"
+    assert_partial(result, "more than 10 elements")
+    assert 0 < len([key for key, _ in events if key == "feeds"]) < 10
+
+
+def test_parser_stops():
+    parser = listparser.Parser(max_elements=10)
+    parser.feed(document)
+    parser.feed(document)
+    result = parser.close()
+    assert_partial(result, "more than 10 elements")
+    assert len(result.feeds) < 10
+
+
+@pytest.mark.skipif(listparser.lxml is None, reason="lxml must be installed")
+def test_parser_stops_while_closing():
+    # lxml doesn't report the incomplete element until the parser is closed.
+    parser = listparser.Parser(max_elements=0)
+    parser.feed(b"<opml")
+    result = parser.close()
+    assert_partial(result, "more than 0 elements")
+
+
+def test_resolve_lists_limits():
+    class Transport:
+        def fetch(self, url, headers):
+            content = '<opml><body><outline type="include" url="http://a/" />'
+            if url == "http://a/":
+                content = document
+            return listparser.transports.Response(url, 200, {}, content.encode())
+
+    result = listparser.parse(
+        "http://root/", transport=Transport(), resolve_lists=True, max_elements=50
+    )
+    assert not result.bozo
+    assert_partial(result.resolved["http://a/"], "more than 50 elements")
@@ -0,0 +1,150 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import pickle
+
+import pytest
+
+import listparser
+import listparser.objects
+
+document = """
+    <opml version="2.0">
+    <head>
+        <title>Subscriptions</title>
+        <ownerName>Example</ownerName>
+        <dateCreated>Sat, 17 Oct 2026 12:00:00 GMT</dateCreated>
+    </head>
+    <body>
+        <outline text="folder">
+            <outline text="feed" xmlUrl="https://domain.example/feed" />
+        </outline>
+        <outline text="list" type="link" url="https://domain.example/list.opml" />
+        <outline htmlUrl="https://domain.example/" />
+    </body>
+    </opml>
+"""
+
+
+def test_slots():
+    default = listparser.parse(document)
+    result = listparser.parse(document, result_type="slots")
+    assert not result.bozo
+
+    feed = result.feeds[0]
+    assert isinstance(feed, listparser.objects.Feed)
+    assert isinstance(result.lists[0], listparser.objects.SubscriptionList)
+    assert isinstance(result.opportunities[0], listparser.objects.Opportunity)
+    assert feed.url == "https://domain.example/feed"
+    assert feed.categories == [["folder"]]
+    assert feed.tags == ["folder"]
+    assert not hasattr(feed, "__dict__")
+    assert repr(feed) == "Feed(url='https://domain.example/feed', title='feed')"
+    for key in ("feeds", "lists", "opportunities"):
+        assert [obj.to_dict() for obj in result[key]] == default[key]
+
+    assert result.meta.title == "Subscriptions"
+    assert result.meta.author.name == "Example"
+    assert result.meta.author.email is None
+    assert result.meta.modified is None
+    assert result.meta.created_parsed == default.meta.created_parsed
+    assert result.meta.to_dict() == default.meta
+    assert repr(result.meta) == "Meta(title='Subscriptions')"
+    assert repr(result.meta.author) == "Author(name='Example')"
+
+
+def test_slots_pickle():
+    result = listparser.parse(document, result_type="slots")
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+@pytest.mark.parametrize(
+    "one, two",
+    (
+        (listparser.objects.Feed("a"), listparser.objects.SubscriptionList("a")),
+        (listparser.objects.Feed("a"), listparser.objects.Feed("b")),
+        (listparser.objects.Meta(title="a"), listparser.objects.Meta()),
+        (listparser.objects.Author(name="a"), listparser.objects.Author()),
+        (listparser.objects.Meta(), {}),
+        (listparser.objects.Author(), {}),
+    ),
+)
+def test_inequality(one, two):
+    assert one != two
+
+
+def test_slots_without_meta_author():
+    result = listparser.parse("<opml />", result_type="slots")
+    assert result.meta.author is None
+    assert result.meta.to_dict() == {}
+
+
+def test_slots_are_created_while_parsing():
+    parser = listparser.Parser(tree=True, result_type="slots")
+    parser.feed(
+        document.replace(
+            "</body>",
+            '<outline xmlUrl="https://domain.example/feed" category="/a" /></body>',
+        )
+    )
+    handler = parser.handler
+    feed = handler.found_urls["https://domain.example/feed"][1]
+    assert isinstance(feed, listparser.objects.Feed)
+    result = parser.close()
+    assert result.feeds == [feed]
+    assert feed.categories == [["folder"], ["a"]]
+    assert feed.tags == ["folder", "a"]
+    assert result.tree.children[0].feeds[0] is feed
+    assert isinstance(result.meta, listparser.objects.Meta)
+
+
+def test_slots_from_foaf():
+    foaf = """
+        <rdf:RDF
+            xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+            xmlns:foaf="http://xmlns.com/foaf/0.1/"
+            xmlns:rss="http://purl.org/rss/1.0/"
+            xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#"
+        >
+            <foaf:Group><foaf:name>group</foaf:name>
+                <foaf:member><foaf:Agent><foaf:weblog><foaf:Document>
+                    <rdfs:seeAlso>
+                        <rss:channel rdf:about="http://feed/" />
+                    </rdfs:seeAlso>
+                </foaf:Document></foaf:weblog></foaf:Agent></foaf:member>
+                <foaf:member><foaf:Agent><foaf:weblog><foaf:Document>
+                    <rdfs:seeAlso>
+                        <rss:channel rdf:about="http://feed/" />
+                    </rdfs:seeAlso>
+                </foaf:Document></foaf:weblog></foaf:Agent></foaf:member>
+            </foaf:Group>
+        </rdf:RDF>
+    """
+    result = listparser.parse(foaf, result_type="slots", tree=True)
+    assert result.feeds == [
+        listparser.objects.Feed("http://feed/", categories=[["group"]], tags=["group"])
+    ]
+    assert result.tree.children[0].feeds == result.feeds
+
+
+class MockTransport:
+    def fetch(self, url, headers):
+        body = '<opml><body><outline xmlUrl="http://feed/" /></body></opml>'
+        if url == "http://list/":
+            body = (
+                '<opml><body><outline type="link" url="http://child/" /></body></opml>'
+            )
+        return listparser.transports.Response(url, 200, {}, body.encode())
+
+
+def test_slots_with_resolved_lists():
+    result = listparser.parse(
+        "http://list/",
+        transport=MockTransport(),
+        resolve_lists=True,
+        result_type="slots",
+    )
+    assert isinstance(result.lists[0], listparser.objects.SubscriptionList)
+    assert isinstance(result.feeds[0], listparser.objects.Feed)
+    assert result.feeds[0].url == "http://feed/"
@@ -0,0 +1,95 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import pathlib
+import unittest.mock
+
+import pytest
+
+import listparser
+import listparser.dates
+
+opml = """
+    <opml version="2.0">
+    <head>
+        <title>Subscriptions</title>
+        <ownerName>Example</ownerName>
+        <dateCreated>Sat, 17 Oct 2026 12:00:00 GMT</dateCreated>
+        <dateModified>Sat, 17 Oct 2026 13:00:00 GMT</dateModified>
+    </head>
+    <body>
+        <outline text="folder">
+            <outline text="feed" xmlUrl="http://feed/" category="a/b" />
+            <outline text="list" type="include" url="http://list/" />
+        </outline>
+        <outline htmlUrl="http://opportunity/" />
+    </body>
+    </opml>
+"""
+
+
+def test_only_feed_urls():
+    with unittest.mock.patch("listparser.dates.parse_rfc822") as parse_rfc822:
+        result = listparser.parse(opml, only={"feeds.url"})
+    parse_rfc822.assert_not_called()
+    assert result.feeds == [
+        {"url": "http://feed/", "title": "", "categories": [], "tags": []}
+    ]
+    assert result.lists == []
+    assert result.opportunities == []
+    assert result.meta == {}
+    assert not result.bozo
+
+
+def test_only_sections():
+    result = listparser.parse(opml, only=["lists", "opportunities.title"])
+    assert result.feeds == []
+    assert result.lists[0].title == "list"
+    assert result.lists[0].tags == ["folder"]
+    assert result.opportunities[0].url == "http://opportunity/"
+
+
+def test_only_meta():
+    result = listparser.parse(opml, only={"meta.title", "meta.created"})
+    assert result.meta.title == "Subscriptions"
+    assert result.meta.created_parsed.hour == 12
+    assert "author" not in result.meta
+    assert "modified" not in result.meta
+    assert result.feeds == []
+
+
+def test_only_string():
+    result = listparser.parse(opml, only="feeds")
+    assert result.feeds[0].categories == [["a", "b"], ["folder"]]
+
+
+def test_only_namespaced_opml():
+    document = opml.replace("<opml ", '<opml xmlns="http://opml.org/spec2" ')
+    result = listparser.parse(document, only={"feeds"})
+    assert result.meta == {}
+    assert len(result.feeds) == 1
+
+
+def test_only_foaf():
+    path = pathlib.Path(__file__).parent / "files/rdf/foaf_group-2.xml"
+    result = listparser.parse(path, only={"feeds.url"})
+    assert result.feeds == [
+        {"url": "http://domain/feed", "title": "", "categories": [], "tags": []}
+    ]
+    assert result.opportunities == []
+    result = listparser.parse(path, only={"feeds.tags"})
+    assert result.feeds[0].tags == ["Planet X"]
+    result = listparser.parse(path, only={"meta"})
+    assert result.feeds == []
+
+
+def test_iterparse_only():
+    events = list(listparser.iterparse(opml, only={"lists"}))
+    assert [key for key, _ in events] == ["meta", "lists", "document"]
+
+
+@pytest.mark.parametrize("name", ("bogus", "feeds.bogus", "meta.url"))
+def test_only_unrecognized(name):
+    with pytest.raises(ValueError, match=name):
+        listparser.parse(opml, only={name})
@@ -0,0 +1,190 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import listparser
+import listparser.cache
+import listparser.resolve
+from listparser.transports import Response
+
+documents = {
+    "http://root/": """
+        <opml><body>
+            <outline xmlUrl="http://feed/1" />
+            <outline text="Reading">
+                <outline text="News" type="include" url="http://a/" />
+            </outline>
+            <outline type="include" url="b.opml" />
+            <outline type="include" url="http://missing/" />
+        </body></opml>
+    """,
+    "http://a/": """
+        <opml><body>
+            <outline text="World">
+                <outline xmlUrl="http://feed/2" />
+            </outline>
+            <outline xmlUrl="http://feed/1" />
+            <outline type="include" url="http://root/" />
+            <outline type="include" url="http://c/" />
+        </body></opml>
+    """,
+    "http://root/b.opml": """
+        <opml><body>
+            <outline category="Tag" xmlUrl="http://feed/3" />
+        </body></opml>
+    """,
+    "http://c/": """
+        <opml><body>
+            <outline xmlUrl="http://feed/4" />
+            <outline htmlUrl="http://opportunity/" />
+            <outline type="include" url="http://d/" />
+        </body></opml>
+    """,
+}
+
+
+class MockTransport:
+    def __init__(self):
+        self.urls = []
+
+    def fetch(self, url, headers):
+        self.urls.append(url)
+        if url not in documents:
+            raise OSError(f"{url} not found")
+        return Response(url, 200, {}, documents[url].encode("utf8"))
+
+
+def test_resolve_lists():
+    transport = MockTransport()
+    result = listparser.parse(
+        "http://root/", transport=transport, resolve_lists=True, max_depth=2
+    )
+    assert not result.bozo
+    assert sorted(transport.urls) == [
+        "http://a/",
+        "http://c/",
+        "http://missing/",
+        "http://root/",
+        "http://root/b.opml",
+    ]
+
+    feeds = {feed.url: feed for feed in result.feeds}
+    assert feeds["http://feed/1"].categories == [["Reading", "News"]]
+    assert feeds["http://feed/2"].categories == [["Reading", "News", "World"]]
+    assert feeds["http://feed/3"].categories == [["Tag"]]
+    assert feeds["http://feed/3"].tags == ["Tag"]
+    assert feeds["http://feed/4"].categories == [["Reading", "News"]]
+    assert result.opportunities[0].url == "http://opportunity/"
+    assert "http://d/" in {obj.url for obj in result.lists}
+
+    assert result.resolved["http://root/"].cycle
+    assert result.resolved["http://root/"].depth == 0
+    assert result.resolved["http://c/"].depth == 2
+    assert not result.resolved["http://a/"].cycle
+    assert result.resolved["http://missing/"].bozo
+    assert isinstance(result.resolved["http://missing/"].bozo_exception, OSError)
+    assert "http://d/" not in result.resolved
+
+
+def test_resolve_lists_max_depth():
+    transport = MockTransport()
+    result = listparser.parse(
+        "http://root/", transport=transport, resolve_lists=True, max_depth=1
+    )
+    assert "http://c/" not in transport.urls
+    assert "http://feed/4" not in {feed.url for feed in result.feeds}
+
+
+def test_resolve_lists_does_not_modify_cached_result():
+    cache = listparser.cache.MemoryCache()
+    root = listparser.parse("http://root/", transport=MockTransport())
+    cache.set("http://root/", root)
+    result = listparser.resolve.resolve_lists(
+        root,
+        lambda url: listparser.parse(url, transport=MockTransport()),
+        max_depth=3,
+    )
+    assert len(result.feeds) > len(root.feeds)
+    assert root.feeds[0].categories == []
+    assert "resolved" not in root
+
+
+def test_resolve_lists_document():
+    document = documents["http://root/"]
+    transport = MockTransport()
+    result = listparser.parse(document, transport=transport, resolve_lists=True)
+    assert result.resolved["http://a/"].depth == 1
+    assert result.resolved["b.opml"].bozo
+    assert isinstance(
+        result.resolved["b.opml"].bozo_exception, listparser.ListparserError
+    )
+    assert "b.opml" not in transport.urls
+
+
+def test_resolve_lists_merges_tags():
+    class Transport:
+        def fetch(self, url, headers):
+            body = """<opml><body>
+                <outline category="One" xmlUrl="http://feed/" />
+                <outline type="include" url="http://other/" />
+            </body></opml>"""
+            if url == "http://other/":
+                body = """<opml><body>
+                    <outline category="One,Two,/Three/Four" xmlUrl="http://feed/" />
+                    <outline category="Two" xmlUrl="http://new/" />
+                </body></opml>"""
+            return Response(url, 200, {}, body.encode("utf8"))
+
+    result = listparser.parse("http://root/", transport=Transport(), resolve_lists=True)
+    feeds = {feed.url: feed for feed in result.feeds}
+    assert feeds["http://feed/"].categories == [["One"], ["Two"], ["Three", "Four"]]
+    assert feeds["http://feed/"].tags == ["One", "Two"]
+    assert feeds["http://new/"].tags == ["Two"]
+
+
+def test_resolve_lists_only():
+    result = listparser.parse(
+        "http://root/",
+        transport=MockTransport(),
+        resolve_lists=True,
+        only={"feeds.url"},
+        tree=True,
+    )
+    assert sorted(feed.url for feed in result.feeds) == [
+        "http://feed/1",
+        "http://feed/2",
+        "http://feed/3",
+        "http://feed/4",
+    ]
+    assert all(feed.title == "" and feed.categories == [] for feed in result.feeds)
+    assert all(feed.tags == [] for feed in result.feeds)
+    assert result.lists == []
+    assert result.tree.children[0].lists == []
+    assert result.opportunities == []
+    assert result.resolved["http://a/"].depth == 1
+
+
+def test_resolve_lists_only_categories():
+    result = listparser.parse(
+        "http://root/",
+        transport=MockTransport(),
+        resolve_lists=True,
+        only=(name for name in ("feeds.categories", "opportunities")),
+    )
+    feeds = {feed.url: feed for feed in result.feeds}
+    assert feeds["http://feed/2"].categories == [["Reading", "News", "World"]]
+    assert feeds["http://feed/3"].tags == ["Tag"]
+    assert [obj.url for obj in result.opportunities] == ["http://opportunity/"]
+    assert result.lists == []
+
+
+def test_resolve_lists_keep_attributes():
+    result = listparser.parse(
+        "http://root/",
+        transport=MockTransport(),
+        resolve_lists=True,
+        keep_attributes={"xmlurl"},
+    )
+    feeds = {feed.url: feed for feed in result.feeds}
+    assert feeds["http://feed/1"].attributes == {"xmlurl": "http://feed/1"}
+    assert feeds["http://feed/2"].attributes == {"xmlurl": "http://feed/2"}
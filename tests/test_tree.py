@@ -0,0 +1,85 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import pathlib
+
+import listparser
+import listparser.objects
+from listparser.transports import Response
+
+opml = """
+    <opml><body>
+        <outline xmlUrl="http://feed/1" />
+        <outline text="b">
+            <outline text="empty" />
+            <outline xmlUrl="http://feed/2">
+                <outline xmlUrl="http://feed/3" />
+            </outline>
+            <outline xmlUrl="http://feed/2" />
+            <outline type="include" url="http://list/" />
+        </outline>
+        <outline text="a">
+            <outline htmlUrl="http://opportunity/" />
+            <outline xmlUrl="http://feed/2" />
+        </outline>
+    </body></opml>
+"""
+
+
+def test_opml_tree():
+    result = listparser.parse(opml, tree=True)
+    root = result.tree
+    assert root.title == ""
+    assert [feed.url for feed in root.feeds] == ["http://feed/1"]
+    assert [child.title for child in root.children] == ["b", "a"]
+
+    b, a = root.children
+    assert [child.title for child in b.children] == ["empty"]
+    assert b.children[0].children == []
+    assert b.children[0].feeds == []
+    assert [feed.url for feed in b.feeds] == ["http://feed/2", "http://feed/3"]
+    assert b.lists[0] is result.lists[0]
+    assert a.opportunities[0] is result.opportunities[0]
+    assert a.feeds[0] is b.feeds[0]
+
+
+def test_no_tree():
+    assert "tree" not in listparser.parse(opml)
+
+
+def test_foaf_tree():
+    path = pathlib.Path(__file__).parent / "files/rdf/foaf_group-2.xml"
+    result = listparser.parse(path, tree=True)
+    (group,) = result.tree.children
+    assert group.title == "Planet X"
+    assert group.feeds[0] is result.feeds[0]
+    assert group.opportunities == []
+
+
+def test_parser_tree():
+    parser = listparser.Parser(tree=True)
+    parser.feed(opml)
+    result = parser.close()
+    assert len(result.tree.children) == 2
+
+
+def test_slots_tree():
+    result = listparser.parse(opml, tree=True, result_type="slots")
+    b, a = result.tree.children
+    assert isinstance(b.feeds[0], listparser.objects.Feed)
+    assert a.feeds[0] is b.feeds[0] is result.feeds[1]
+
+
+class MockTransport:
+    def fetch(self, url, headers):
+        content = opml if url == "http://root/" else "<opml />"
+        return Response(url, 200, {}, content.encode("utf8"))
+
+
+def test_resolved_tree():
+    result = listparser.parse(
+        "http://root/", transport=MockTransport(), resolve_lists=True, tree=True
+    )
+    b, a = result.tree.children
+    assert a.feeds[0] is b.feeds[0] is result.feeds[1]
@@ -0,0 +1,101 @@
+# This file is part of listparser.
+# Copyright 2009-2026 Kurt McKee <contactme@kurtmckee.org>
+# SPDX-License-Identifier: MIT
+
+import datetime
+
+import pytest
+
+import listparser
+import listparser.objects
+
+document = """
+    <opml version="2.0">
+    <head>
+        <title>Title &amp; more</title>
+        <dateCreated>Sat, 07 Sep 2002 00:00:01 GMT</dateCreated>
+        <ownerName>Name</ownerName>
+        <ownerId>http://owner/</ownerId>
+    </head>
+    <body>
+        <outline text="a">
+            <outline text="b">
+                <outline text="1" xmlUrl="http://1/" category="/x/y,/z" />
+            </outline>
+            <outline text="&quot;2&quot;&#10;" xmlUrl="http://2/" />
+        </outline>
+        <outline text="3" xmlUrl="http://3/" />
+        <outline text="a">
+            <outline text="1" xmlUrl="http://1/" />
+            <outline text="list" type="include" url="http://list/" />
+        </outline>
+        <outline text="" htmlUrl="http://opportunity/" />
+    </body>
+    </opml>
+"""
+
+
+@pytest.mark.parametrize("result_type", ("dict", "slots"))
+@pytest.mark.parametrize("version", ("opml1", "opml2"))
+def test_round_trip(result_type, version):
+    result = listparser.parse(document, result_type=result_type)
+    output = listparser.dumps(result, version=version)
+    round_trip = listparser.parse(output, result_type=result_type)
+    assert round_trip.bozo is False
+    assert round_trip.version == version
+    for key in ("feeds", "lists", "opportunities"):
+        assert round_trip[key] == result[key]
+    assert round_trip.meta.title == "Title & more"
+    assert round_trip.meta.created_parsed == result.meta.created_parsed
+    assert round_trip.meta.author.name == "Name"
+    if version == "opml2":
+        assert round_trip.meta == result.meta
+    else:
+        assert "ownerId" not in output
+
+
+def test_folders_are_rebuilt_from_categories():
+    output = listparser.dumps(listparser.parse(document))
+    body = output.partition("<body>")[2]
+    assert body.count('<outline text="a">') == 2
+    assert body.count('<outline text="b">') == 0
+    assert 'category="/x/y,/z,/a/b"' in body
+
+
+def test_dump_to_file(tmp_path):
+    path = tmp_path / "export.opml"
+    with path.open("w", encoding="utf-8") as file:
+        listparser.dump(listparser.parse(document), file)
+    assert path.read_text().startswith('<?xml version="1.0" encoding="utf-8"?>')
+    assert listparser.parse(path).feeds[0].url == "http://1/"
+
+
+def test_parsed_dates_are_formatted():
+    created = datetime.datetime(2002, 9, 7, tzinfo=datetime.timezone.utc)
+    result = {"meta": listparser.objects.Meta(created_parsed=created)}
+    output = listparser.dumps(result)
+    assert "<dateCreated>Sat, 07 Sep 2002 00:00:00 GMT</dateCreated>" in output
+
+
+def test_empty_result():
+    result = listparser.parse(listparser.dumps({}))
+    assert result.bozo is False
+    assert result.feeds == []
+
+
+def test_unsupported_version():
+    with pytest.raises(ValueError, match="not a supported version"):
+        listparser.dumps({}, version="rdf")
+
+
+def test_sibling_folders():
+    result = listparser.parse("""
+        <opml><body><outline text="a">
+            <outline text="b"><outline text="1" xmlUrl="http://1/" /></outline>
+            <outline text="c"><outline text="2" xmlUrl="http://2/" /></outline>
+        </outline></body></opml>
+        """)
+    output = listparser.dumps(result)
+    assert output.count('<outline text="a">') == 1
+    assert output.count("</outline>") == 3
+    assert listparser.parse(output).feeds == result.feeds
@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: MIT
 
 import datetime  # noqa: F401 (required by evals)
+import io
+import mmap
 import pathlib
 import unittest.mock
 
@@ -46,6 +48,69 @@ def test_get_content_bad(use_dict):
     assert info["bozo"]
 
 
+feed_doc = b'<opml><body><outline text="a" xmlUrl="http://a/" /></body></opml>'
+
+
+@pytest.fixture
+def feed_path(tmp_path):
+    path = tmp_path / "feeds.opml"
+    path.write_bytes(feed_doc)
+    return path
+
+
+@pytest.fixture(
+    params=["path", "file", "bytearray", "memoryview", "mmap"],
+)
+def source(request, feed_path):
+    if request.param == "path":
+        yield feed_path
+    elif request.param == "file":
+        with feed_path.open("rb") as file:
+            yield file
+    elif request.param == "bytearray":
+        yield bytearray(feed_doc)
+    elif request.param == "memoryview":
+        yield memoryview(feed_doc)
+    else:
+        with feed_path.open("rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+
+@pytest.mark.parametrize("chunk_size", (5, 64 * 1024))
+def test_parse_sources(use_dict, source, chunk_size, monkeypatch):
+    monkeypatch.setattr(listparser, "CHUNK_SIZE", chunk_size)
+    result = listparser.parse(source)
+    assert not result["bozo"]
+    assert result["feeds"][0]["url"] == "http://a/"
+
+
+def test_iterparse_sources(use_dict, source, monkeypatch):
+    monkeypatch.setattr(listparser, "CHUNK_SIZE", 5)
+    events = list(listparser.iterparse(source))
+    assert [key for key, _ in events] == ["meta", "feeds", "document"]
+    assert not events[-1][1]["bozo"]
+
+
+def test_parse_path_not_found(use_dict, tmp_path):
+    result = listparser.parse(tmp_path / "bogus.opml")
+    assert result["bozo"]
+    assert isinstance(result["bozo_exception"], OSError)
+
+
+def test_iterparse_path_not_found(use_dict, tmp_path):
+    events = list(listparser.iterparse(tmp_path / "bogus.opml"))
+    assert events[-1][1]["bozo"]
+    assert isinstance(events[-1][1]["bozo_exception"], OSError)
+
+
+def test_parser_feed_file(use_dict):
+    parser = listparser.Parser()
+    parser.feed_file(io.BytesIO(feed_doc))
+    result = parser.close()
+    assert result["feeds"][0]["url"] == "http://a/"
+
+
 tests = []
 for _file in tests_path.rglob("**/*.xml"):
     _info = {}
@@ -84,3 +149,215 @@ def test_file(use_dict, src, assertions):
     lxml = listparser.lxml  # noqa: F841
     for assertion in assertions:
         assert eval(assertion)
+
+
+available_backends = [
+    name
+    for name, backend_class in listparser.backends.registry.items()
+    if backend_class.available
+]
+
+
+@pytest.mark.parametrize("backend", available_backends)
+@pytest.mark.parametrize("src, assertions", tests)
+def test_file_backend(use_dict, src, assertions, backend):
+    # `result` must exist in the local scope for the assertions to run.
+    result = listparser.parse(src, backend=backend)  # noqa: F841
+    lxml = listparser.lxml  # noqa: F841
+    for assertion in assertions:
+        assert eval(assertion)
+
+
+def iterparse_result(src):
+    result = {"feeds": [], "lists": [], "opportunities": []}
+    for key, value in listparser.iterparse(src):
+        if key == "meta":
+            result["meta"] = value
+        elif key == "document":
+            result.update(value)
+        else:
+            result[key].append(value)
+    return result
+
+
+@pytest.mark.parametrize("src, assertions", tests)
+def test_file_iterparse(use_dict, src, assertions, monkeypatch):
+    # Force the document to be fed to the parser in many small chunks.
+    monkeypatch.setattr(listparser, "CHUNK_SIZE", 16)
+
+    # `result` must exist in the local scope for the assertions to run.
+    result = iterparse_result(src)  # noqa: F841
+    lxml = listparser.lxml  # noqa: F841
+    for assertion in assertions:
+        assert eval(assertion)
+
+
+def test_iterparse_event_order(use_dict):
+    src = """
+        <opml version="2.0">
+            <head><title>a</title></head>
+            <body>
+                <outline text="b" xmlUrl="http://b/" />
+                <outline text="c" type="include" url="http://c/" />
+                <outline htmlUrl="http://d/" />
+                <outline text="b" xmlUrl="http://b/" />
+            </body>
+        </opml>
+    """
+    events = list(listparser.iterparse(src))
+    assert [key for key, _ in events] == [
+        "meta",
+        "feeds",
+        "lists",
+        "opportunities",
+        "document",
+    ]
+    assert events[0][1] == {"title": "a"}
+    assert events[-1][1]["version"] == "opml2"
+
+
+def test_iterparse_meta_without_head(use_dict):
+    events = list(listparser.iterparse("<opml><body /></opml>"))
+    assert events[-1][1].pop("backend") in ("lxml-html", "html.parser")
+    assert events == [
+        ("meta", {}),
+        ("document", {"bozo": False, "bozo_exception": None, "version": "opml"}),
+    ]
+
+
+def test_iterparse_bad_content(use_dict):
+    events = list(listparser.iterparse(0))
+    assert [key for key, _ in events] == ["meta", "document"]
+    assert events[-1][1]["bozo"]
+
+
+@pytest.mark.parametrize("src, assertions", tests)
+def test_file_parser(use_dict, src, assertions):
+    content = src.encode("utf8")
+    parser = listparser.Parser()
+    for offset in range(0, len(content), 7):
+        parser.feed(content[offset : offset + 7])
+
+    # `result` must exist in the local scope for the assertions to run.
+    result = parser.close()  # noqa: F841
+    lxml = listparser.lxml  # noqa: F841
+    for assertion in assertions:
+        assert eval(assertion)
+
+
+def test_parser_without_content(use_dict):
+    parser = listparser.Parser()
+    parser.feed(b"")
+    result = parser.close()
+    assert not result["bozo"]
+    assert result["feeds"] == []
+
+
+def test_parser_read_events(use_dict):
+    parser = listparser.Parser(stream=True)
+    parser.feed(b'<opml><body><outline xmlUrl="http://a/" />')
+    assert [key for key, _ in parser.read_events()] == ["meta", "feeds"]
+    parser.feed(b'<outline xmlUrl="http://b/" /></body></opml>')
+    result = parser.close()
+    assert [value["url"] for _, value in parser.read_events()] == ["http://b/"]
+    assert result["feeds"] == []
+
+
+def test_parser_buffered_document(use_dict):
+    # The content is too short to begin parsing until the parser is closed.
+    parser = listparser.Parser()
+    parser.feed(b"<opml")
+    assert parser.prefix
+    result = parser.close()
+    assert not parser.prefix
+    assert result["feeds"] == []
+
+
+def test_shared_category_paths(use_dict):
+    result = listparser.parse("""
+        <opml><body>
+            <outline text="a"><outline text="b">
+                <outline xmlUrl="http://1/" />
+                <outline xmlUrl="http://2/" category="c,a/b" />
+            </outline></outline>
+            <outline xmlUrl="http://3/" category="a/b" />
+        </body></opml>
+        """)
+    one, two, three = (feed["categories"] for feed in result["feeds"])
+    assert one == [["a", "b"]]
+    assert two == [["c"], ["a", "b"]]
+    assert one[0] is two[1] is three[0]
+
+
+@pytest.mark.parametrize("backend", ("auto", "expat", "html.parser"))
+def test_deeply_nested_categories(use_dict, backend):
+    depth = 5000
+    result = listparser.parse(
+        "<opml><body>"
+        + '<outline text="a">' * depth
+        + '<outline xmlUrl="http://1/" />'
+        + "</outline>" * depth
+        + "</body></opml>",
+        backend=backend,
+    )
+    assert not result["bozo"]
+    assert result["feeds"][0]["categories"] == [["a"] * depth]
+
+
+def test_category_paths_are_only_built_when_needed(use_dict):
+    root = listparser.common.CategoryPath()
+    a = root.child("a")
+    abc = a.child("b").child("c")
+    assert abc.as_list() == ["a", "b", "c"]
+    assert a.names is None
+    assert a.as_list() == ["a"]
+    assert a.child("b").child("d").as_list() == ["a", "b", "d"]
+
+
+def test_dispatch_tables_are_shared(use_dict):
+    handler = listparser.Handler()
+    assert handler.start_methods is listparser.Handler.start_dispatch
+    assert handler.start_methods[("", "outline")] is (
+        listparser.Handler.start_opml_outline
+    )
+    assert handler.end_methods[("foaf", "group")] is listparser.Handler.end_foaf_group
+
+
+def test_disabled_handlers_are_not_shared(use_dict):
+    handler = listparser.Handler()
+    handler.disable_handlers([("", "title")])
+    handler.disable_handlers([("opml", "title")])
+    assert handler.start_methods[("", "title")] is None
+    assert handler.start_methods[("opml", "title")] is None
+    assert listparser.Handler.start_dispatch[("", "title")] is not None
+
+    # Other handlers still use the class dispatch tables.
+    doc = "<opml><head><title>x</title></head></opml>"
+    assert listparser.parse(doc)["meta"]["title"] == "x"
+
+
+def test_handler_can_be_reused(use_dict):
+    handler = listparser.Parser(max_elements=4).handler
+    # The elements are not closed, and the namespace remains in scope.
+    document = (
+        '<opml xmlns:x="http://opml.org/spec2"><body><x:outline xmlUrl="http://a/" />'
+    )
+    for _ in range(2):
+        backend = listparser.backends.HTMLParserBackend(handler, None)
+        backend.feed(document)
+        backend.close()
+        assert not handler.node_stack
+        assert not handler.uris
+    assert [feed["url"] for feed in handler.harvest["feeds"]] == ["http://a/"] * 2
+
+
+def test_tag_resolution_follows_namespace_scope(use_dict):
+    result = listparser.parse("""
+        <opml><body>
+            <x:outline xmlns:x="http://opml.org/spec2" xmlUrl="http://1/" />
+            <x:outline xmlns:x="http://example.com/" xmlUrl="http://2/" />
+            <x:outline xmlUrl="http://3/" />
+            <x:outline xmlns:x="http://opml.org/spec2" xmlUrl="http://4/" />
+        </body></opml>
+        """)
+    assert [feed["url"] for feed in result["feeds"]] == ["http://1/", "http://4/"]